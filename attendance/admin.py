@@ -1,7 +1,15 @@
-from django.contrib import admin
-
 from django.contrib import admin
 from .models import Attendance, Performance
 
-admin.site.register(Attendance)
-admin.site.register(Performance)
+
+# list_select_related joins the employee so rendering its name doesn't cost a query per row
+@admin.register(Attendance)
+class AttendanceAdmin(admin.ModelAdmin):
+    list_display = ('employee', 'date', 'status')
+    list_select_related = ('employee',)
+
+
+@admin.register(Performance)
+class PerformanceAdmin(admin.ModelAdmin):
+    list_display = ('employee', 'review_date', 'rating')
+    list_select_related = ('employee',)
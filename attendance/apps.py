@@ -4,3 +4,14 @@ from django.apps import AppConfig
 class AttendanceConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'attendance'
+
+    def ready(self):
+        from django.db.models.signals import post_save, post_delete
+        from . import list_cache
+        from .models import Attendance, Performance
+
+        # Any write (API, admin, soft-delete cascades) expires the model's cached list pages
+        post_save.connect(list_cache.invalidate_attendance, sender=Attendance, dispatch_uid='attendance_list_cache_save')
+        post_delete.connect(list_cache.invalidate_attendance, sender=Attendance, dispatch_uid='attendance_list_cache_delete')
+        post_save.connect(list_cache.invalidate_performance, sender=Performance, dispatch_uid='performance_list_cache_save')
+        post_delete.connect(list_cache.invalidate_performance, sender=Performance, dispatch_uid='performance_list_cache_delete')
@@ -0,0 +1,32 @@
+"""
+FilterSets for the attendance and performance endpoints.
+Declared once at import time, so the FilterSet metaclass does its work a
+single time instead of on every request.
+
+Range lookups (?date__gte=, ?rating__gte=, ...) push the WHERE clause into
+SQL so the (employee, -date) / (rating, -review_date) indexes are usable.
+List lookups take comma-separated values, e.g. ?status__in=Late,Absent.
+"""
+from django_filters import rest_framework as filters
+
+from .models import Attendance, Performance
+
+
+class AttendanceFilter(filters.FilterSet):
+    class Meta:
+        model = Attendance
+        fields = {
+            'status': ['exact', 'in'],
+            'date': ['exact', 'gte', 'lte', 'range'],
+            'employee': ['exact', 'in'],
+        }
+
+
+class PerformanceFilter(filters.FilterSet):
+    class Meta:
+        model = Performance
+        fields = {
+            'rating': ['exact', 'gte', 'lte'],
+            'review_date': ['exact', 'gte', 'lte'],
+            'employee': ['exact', 'in'],
+        }
@@ -0,0 +1,39 @@
+"""
+Versioned cache for the attendance and performance list pages.
+
+Pages aren't deleted on writes (LocMemCache has no pattern delete). Each
+cached page is stored with the version that was current when it was
+rendered, and every write to the model bumps the version, so all of a
+viewset's cached pages go stale at once.
+
+Writes are caught by post_save/post_delete receivers (connected in
+AttendanceConfig.ready), so the admin and safedelete cascades expire
+pages too. They bump the version once the write commits: bumped earlier,
+a concurrent list could cache the pre-commit rows under the new version. Bulk paths that skip signals (bulk_create, update) call
+invalidate() themselves.
+"""
+import time
+from functools import partial
+
+from django.core.cache import cache
+from django.db import transaction
+
+ATTENDANCE_PREFIX = 'att:list'
+PERFORMANCE_PREFIX = 'perf:list'
+
+
+def version_key(prefix):
+    return f'{prefix}:version'
+
+
+def invalidate(prefix):
+    """Make every cached list page under prefix stale."""
+    cache.set(version_key(prefix), time.time_ns(), None)
+
+
+def invalidate_attendance(sender, **kwargs):
+    transaction.on_commit(partial(invalidate, ATTENDANCE_PREFIX))
+
+
+def invalidate_performance(sender, **kwargs):
+    transaction.on_commit(partial(invalidate, PERFORMANCE_PREFIX))
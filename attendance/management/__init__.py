@@ -0,0 +1 @@
+# Management package initialization
\ No newline at end of file
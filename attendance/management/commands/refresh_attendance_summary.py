@@ -0,0 +1,28 @@
+"""
+Management command to refresh the 30-day attendance summary.
+Run this from cron (e.g. hourly) so reports read pre-aggregated counts.
+"""
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+
+class Command(BaseCommand):
+    help = 'Refresh the att_30d_summary materialized view (PostgreSQL only)'
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            self.stdout.write(
+                self.style.WARNING(
+                    f'Materialized views require PostgreSQL (current backend: {connection.vendor}). '
+                    'Reports compute the summary live instead.'
+                )
+            )
+            return
+
+        with connection.cursor() as cursor:
+            # CONCURRENTLY keeps the view readable while it is rebuilt
+            cursor.execute('REFRESH MATERIALIZED VIEW CONCURRENTLY att_30d_summary')
+
+        self.stdout.write(
+            self.style.SUCCESS('Attendance summary refreshed successfully')
+        )
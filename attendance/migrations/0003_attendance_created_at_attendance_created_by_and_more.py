@@ -0,0 +1,113 @@
+# Generated by Django 5.2.4 on 2026-10-14 05:34
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attendance", "0002_alter_performance_rating_and_more"),
+        ("employees", "0005_auditlog_department_created_at_department_created_by_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="attendance",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="attendance",
+            name="created_by",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="User who created this record",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="%(class)s_created",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddField(
+            model_name="attendance",
+            name="deleted",
+            field=models.DateTimeField(db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="attendance",
+            name="deleted_by_cascade",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name="attendance",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="attendance",
+            name="updated_by",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="User who last updated this record",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="%(class)s_updated",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddField(
+            model_name="performance",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="performance",
+            name="created_by",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="User who created this record",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="%(class)s_created",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddField(
+            model_name="performance",
+            name="deleted",
+            field=models.DateTimeField(db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="performance",
+            name="deleted_by_cascade",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name="performance",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="performance",
+            name="updated_by",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="User who last updated this record",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="%(class)s_updated",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="attendance",
+            index=models.Index(fields=["-date", "-id"], name="attendance__date_4f6cf3_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="performance",
+            index=models.Index(fields=["-review_date", "-id"], name="attendance__review__427cad_idx"),
+        ),
+    ]
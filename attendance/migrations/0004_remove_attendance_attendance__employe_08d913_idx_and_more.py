@@ -0,0 +1,52 @@
+# Generated by Django 5.2.4 on 2026-10-14 05:35
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attendance", "0003_attendance_created_at_attendance_created_by_and_more"),
+        ("employees", "0005_auditlog_department_created_at_department_created_by_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="attendance",
+            name="attendance__employe_08d913_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="attendance",
+            name="attendance__date_61f2e1_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="attendance",
+            name="attendance__status_132c06_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="performance",
+            name="attendance__employe_dfc441_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="performance",
+            name="attendance__rating_518c92_idx",
+        ),
+        migrations.AddIndex(
+            model_name="attendance",
+            index=models.Index(fields=["employee", "-date"], name="att_emp_date_desc"),
+        ),
+        migrations.AddIndex(
+            model_name="attendance",
+            index=models.Index(fields=["status", "-date"], name="att_status_date_desc"),
+        ),
+        migrations.AddIndex(
+            model_name="performance",
+            index=models.Index(fields=["employee", "-review_date"], name="perf_emp_review_desc"),
+        ),
+        migrations.AddIndex(
+            model_name="performance",
+            index=models.Index(fields=["rating", "-review_date"], name="perf_rating_review_desc"),
+        ),
+    ]
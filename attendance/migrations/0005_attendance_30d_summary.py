@@ -0,0 +1,53 @@
+# Generated by Django 5.2.4 on 2026-10-14 05:39
+
+from django.db import migrations, models
+
+# Materialized views are PostgreSQL-only; other backends (e.g. the SQLite
+# test database) fall back to a live GROUP BY in the report code.
+CREATE_SUMMARY_VIEW = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS att_30d_summary AS
+SELECT status, count(*)::integer AS count
+FROM attendance_attendance
+WHERE date >= current_date - 30 AND deleted IS NULL
+GROUP BY status
+"""
+
+# REFRESH ... CONCURRENTLY requires a unique index on the view
+CREATE_SUMMARY_INDEX = "CREATE UNIQUE INDEX IF NOT EXISTS att_30d_summary_status ON att_30d_summary (status)"
+
+DROP_SUMMARY_VIEW = "DROP MATERIALIZED VIEW IF EXISTS att_30d_summary"
+
+
+def create_summary_view(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(CREATE_SUMMARY_VIEW)
+    schema_editor.execute(CREATE_SUMMARY_INDEX)
+
+
+def drop_summary_view(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(DROP_SUMMARY_VIEW)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attendance", "0004_remove_attendance_attendance__employe_08d913_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AttendanceSummary30d",
+            fields=[
+                ("status", models.CharField(max_length=10, primary_key=True, serialize=False)),
+                ("count", models.IntegerField()),
+            ],
+            options={
+                "db_table": "att_30d_summary",
+                "managed": False,
+            },
+        ),
+        migrations.RunPython(create_summary_view, drop_summary_view),
+    ]
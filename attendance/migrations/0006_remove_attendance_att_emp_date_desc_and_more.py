@@ -0,0 +1,48 @@
+# Generated by Django 5.2.4 on 2026-10-14 05:41
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attendance", "0005_attendance_30d_summary"),
+        ("employees", "0005_auditlog_department_created_at_department_created_by_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="attendance",
+            name="att_emp_date_desc",
+        ),
+        migrations.RemoveIndex(
+            model_name="performance",
+            name="perf_emp_review_desc",
+        ),
+        migrations.AlterUniqueTogether(
+            name="attendance",
+            unique_together=set(),
+        ),
+        migrations.AlterUniqueTogether(
+            name="performance",
+            unique_together=set(),
+        ),
+        migrations.AddIndex(
+            model_name="attendance",
+            index=models.Index(fields=["employee", "-date"], include=("status",), name="att_emp_date_desc"),
+        ),
+        migrations.AddIndex(
+            model_name="performance",
+            index=models.Index(fields=["employee", "-review_date"], include=("rating",), name="perf_emp_review_desc"),
+        ),
+        migrations.AddConstraint(
+            model_name="attendance",
+            constraint=models.UniqueConstraint(fields=("employee", "date"), name="uniq_att_emp_date"),
+        ),
+        migrations.AddConstraint(
+            model_name="performance",
+            constraint=models.UniqueConstraint(fields=("employee", "review_date"), name="uniq_perf_emp_review"),
+        ),
+    ]
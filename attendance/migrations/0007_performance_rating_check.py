@@ -0,0 +1,29 @@
+# Generated by Django 5.2.4 on 2026-10-14 05:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attendance", "0006_remove_attendance_att_emp_date_desc_and_more"),
+        ("employees", "0005_auditlog_department_created_at_department_created_by_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="performance",
+            name="rating",
+            field=models.IntegerField(help_text="Rating must be between 1 and 5"),
+        ),
+        migrations.AddConstraint(
+            model_name="performance",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("rating__gte", 1), ("rating__lte", 5)),
+                name="perf_rating_1_5",
+                violation_error_message="Rating must be between 1 and 5.",
+            ),
+        ),
+    ]
@@ -1,5 +1,4 @@
 from django.db import models
-from django.core.validators import MinValueValidator, MaxValueValidator
 from employees.models import Employee
 from employees.mixins import BaseModel
 
@@ -17,32 +16,57 @@ class Attendance(BaseModel):
 
     class Meta:
         # Ensure one attendance record per employee per date
-        unique_together = ['employee', 'date']
+        constraints = [
+            models.UniqueConstraint(fields=['employee', 'date'], name='uniq_att_emp_date'),
+        ]
+        # Composite indexes match the API's filter + newest-first ordering shapes
         indexes = [
-            models.Index(fields=['employee', 'date']),
-            models.Index(fields=['date']),
-            models.Index(fields=['status']),
+            # INCLUDE status so ?employee=&date= lookups are index-only scans (PostgreSQL)
+            models.Index(fields=['employee', '-date'], include=['status'], name='att_emp_date_desc'),
+            models.Index(fields=['status', '-date'], name='att_status_date_desc'),
+            models.Index(fields=['-date', '-id']),  # cursor pagination order
         ]
 
     def __str__(self):
-        return f"{self.employee.name} - {self.date} - {self.status}"  # Display attendance summary
+        # employee_id, not employee.name: repr'ing a row must not trigger a query
+        return f"{self.employee_id} - {self.date} - {self.status}"  # Display attendance summary
 
 # Performance model to store employee performance ratings
 class Performance(BaseModel):
     employee = models.ForeignKey(Employee, on_delete=models.CASCADE)
-    rating = models.IntegerField(
-        validators=[MinValueValidator(1), MaxValueValidator(5)],
-        help_text="Rating must be between 1 and 5"
-    )
+    rating = models.IntegerField(help_text="Rating must be between 1 and 5")
     review_date = models.DateField()
 
     class Meta:
         # Ensure one review per employee per date
-        unique_together = ['employee', 'review_date']
+        constraints = [
+            models.UniqueConstraint(fields=['employee', 'review_date'], name='uniq_perf_emp_review'),
+            # Enforced by the database instead of field validators; full_clean() still checks it
+            models.CheckConstraint(
+                condition=models.Q(rating__gte=1) & models.Q(rating__lte=5),
+                name='perf_rating_1_5',
+                violation_error_message='Rating must be between 1 and 5.',
+            ),
+        ]
         indexes = [
-            models.Index(fields=['employee', 'review_date']),
-            models.Index(fields=['rating']),
+            models.Index(fields=['employee', '-review_date'], include=['rating'], name='perf_emp_review_desc'),
+            models.Index(fields=['rating', '-review_date'], name='perf_rating_review_desc'),
+            models.Index(fields=['-review_date', '-id']),  # cursor pagination order
         ]
 
     def __str__(self):
-        return f"{self.employee.name} - Rating: {self.rating}"  # Display performance summary
+        return f"{self.employee_id} - Rating: {self.rating}"  # Display performance summary
+
+
+# Read-only view over the att_30d_summary materialized view (PostgreSQL only).
+# Created in migration 0005 and refreshed by `manage.py refresh_attendance_summary`.
+class AttendanceSummary30d(models.Model):
+    status = models.CharField(max_length=10, primary_key=True)
+    count = models.IntegerField()
+
+    class Meta:
+        managed = False
+        db_table = 'att_30d_summary'
+
+    def __str__(self):
+        return f"{self.status}: {self.count}"
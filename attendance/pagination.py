@@ -0,0 +1,16 @@
+"""
+Cursor pagination for the attendance and performance list endpoints.
+Pages are fetched with a range scan on (date, id) instead of OFFSET,
+so deep pages cost the same as the first one.
+"""
+from rest_framework.pagination import CursorPagination
+
+
+class AttendanceCursorPagination(CursorPagination):
+    ordering = ('-date', '-id')
+    page_size = 50
+
+
+class PerformanceCursorPagination(CursorPagination):
+    ordering = ('-review_date', '-id')
+    page_size = 50
@@ -5,10 +5,13 @@ from .models import Attendance, Performance
 class AttendanceSerializer(serializers.ModelSerializer):
     class Meta:
         model = Attendance
-        fields = '__all__'  # Include all fields
+        # Explicit fields (not '__all__') so list views can project just these columns
+        fields = ('id', 'employee', 'date', 'status', 'created_at', 'updated_at')
 
 # Serializer for Performance model
 class PerformanceSerializer(serializers.ModelSerializer):
     class Meta:
         model = Performance
-        fields = '__all__'
+        fields = ('id', 'employee', 'rating', 'review_date', 'created_at', 'updated_at')
+        # The 1-5 range lives in a DB CHECK constraint; keep API errors as 400s, not IntegrityErrors
+        extra_kwargs = {'rating': {'min_value': 1, 'max_value': 5}}
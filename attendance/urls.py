@@ -1,4 +1,3 @@
-from django.urls import path, include
 from rest_framework.routers import DefaultRouter
 from .views import AttendanceViewSet, PerformanceViewSet
 
@@ -7,6 +6,6 @@ router = DefaultRouter()
 router.register(r'attendance', AttendanceViewSet)
 router.register(r'performance', PerformanceViewSet)
 
-urlpatterns = [
-    path('', include(router.urls)),
-]
+# Built once at import; the project urls mount this same list for v1 and the
+# legacy prefix, so both share the compiled route patterns
+urlpatterns = router.urls
@@ -1,32 +1,127 @@
+import csv
+import hashlib
+import itertools
+import time
+
+from django.core.cache import cache
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets, filters
-from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from employee_project.filters import LazyDjangoFilterBackend
+from . import list_cache
+from .filters import AttendanceFilter, PerformanceFilter
 from .models import Attendance, Performance
 from .serializers import AttendanceSerializer, PerformanceSerializer
+from .pagination import AttendanceCursorPagination, PerformanceCursorPagination
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 
 
-class AttendanceViewSet(viewsets.ModelViewSet):
+class _EchoBuffer:
+    """File-like object whose write() returns the value, so csv.writer can feed a stream."""
+    def write(self, value):
+        return value
+
+
+class ListProjectionMixin:
+    """
+    On list requests, SELECT only the columns the serializer renders.
+    Other actions load full rows since saves and deletes touch every field.
+    """
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        if self.action == 'list':
+            queryset = queryset.only(*self.get_serializer_class().Meta.fields)
+        return queryset
+
+
+class CachedListMixin:
+    """
+    Cache list responses per (URL, user) for a short time.
+
+    Pages are stored with the list_cache version they were rendered under
+    (see list_cache); signal handlers bump the version on every write, and
+    one get_many fetches the version and the page together.
+    """
+    list_cache_prefix = None
+    list_cache_timeout = 60  # seconds
+
+    def list(self, request, *args, **kwargs):
+        version_key = list_cache.version_key(self.list_cache_prefix)
+        page_key = self.get_list_cache_key(request)
+        cached = cache.get_many([version_key, page_key])
+        version = cached.get(version_key)
+        page = cached.get(page_key)
+        if version is not None and page is not None and page[0] == version:
+            return Response(page[1])
+
+        if version is None:
+            # No write seen yet (or the key was evicted); if another request set one first, don't cache
+            version = time.time_ns()
+            if not cache.add(version_key, version, None):
+                version = None
+
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == 200 and version is not None:
+            cache.set(page_key, (version, response.data), self.list_cache_timeout)
+        return response
+
+    def get_list_cache_key(self, request):
+        user = request.user.pk if request.user.is_authenticated else 'anon'
+        # Hash the absolute URL so long query strings stay within backend key limits
+        url_hash = hashlib.sha256(request.build_absolute_uri().encode()).hexdigest()
+        return f'{self.list_cache_prefix}:{user}:{url_hash}'
+
+
+class AttendanceViewSet(CachedListMixin, ListProjectionMixin, viewsets.ModelViewSet):
     """
-    list: List attendance. Filter by ?employee=, ?date=, ?status=. Order with ?ordering=-date.
+    list: List attendance (cursor paginated). Filter by ?employee=, ?date= (or ?date__gte=/?date__lte=/?date__range=), ?status= (or ?status__in=). Order with ?ordering=-date.
     create: Create attendance (JWT required).
+    export: Stream all matching attendance as CSV. Accepts the same filters and ordering as list.
     """
+    # No select_related: the serializer renders employee as a primary key, read from employee_id
     queryset = Attendance.objects.all()
     serializer_class = AttendanceSerializer
+    list_cache_prefix = list_cache.ATTENDANCE_PREFIX
+    pagination_class = AttendanceCursorPagination
     permission_classes = [IsAuthenticatedOrReadOnly]
-    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
-    filterset_fields = ['status', 'date', 'employee']
+    filter_backends = [LazyDjangoFilterBackend, filters.OrderingFilter]
+    filterset_class = AttendanceFilter
     ordering_fields = ['id', 'date', 'status', 'employee']
-    ordering = ['-date']  # newest first
+    ordering = ['-date', '-id']  # newest first; id breaks ties so cursors are stable
+
+    @action(detail=False, methods=['get'])
+    def export(self, request, *args, **kwargs):
+        """Stream attendance rows as CSV without loading the whole table into memory."""
+        queryset = (
+            self.filter_queryset(self.get_queryset())
+            .only('employee_id', 'date', 'status')
+            .iterator(chunk_size=2000)  # server-side cursor on PostgreSQL
+        )
+        writer = csv.writer(_EchoBuffer())
+        rows = (
+            writer.writerow((record.employee_id, record.date.isoformat(), record.status))
+            for record in queryset
+        )
+        header = writer.writerow(('employee', 'date', 'status'))
+
+        response = StreamingHttpResponse(
+            itertools.chain((header,), rows), content_type='text/csv'
+        )
+        response['Content-Disposition'] = 'attachment; filename="attendance.csv"'
+        return response
 
-class PerformanceViewSet(viewsets.ModelViewSet):
+class PerformanceViewSet(CachedListMixin, ListProjectionMixin, viewsets.ModelViewSet):
     """
-    list: List performance reviews. Filter by ?employee=, ?rating=, ?review_date=.
+    list: List performance reviews (cursor paginated). Filter by ?employee=, ?rating= (or ?rating__gte=), ?review_date= (or ?review_date__gte=).
     create: Create a review (JWT required).
     """
     queryset = Performance.objects.all()
     serializer_class = PerformanceSerializer
+    list_cache_prefix = list_cache.PERFORMANCE_PREFIX
+    pagination_class = PerformanceCursorPagination
     permission_classes = [IsAuthenticatedOrReadOnly]
-    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
-    filterset_fields = ['rating', 'review_date', 'employee']
+    filter_backends = [LazyDjangoFilterBackend, filters.OrderingFilter]
+    filterset_class = PerformanceFilter
     ordering_fields = ['id', 'rating', 'review_date', 'employee']
-    ordering = ['-review_date']
+    ordering = ['-review_date', '-id']
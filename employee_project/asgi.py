@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'employee_project.settings')
+# Serving requests: write audit entries on the background thread (unless set explicitly)
+os.environ.setdefault('AUDIT_LOG_ASYNC', 'True')
 
 application = get_asgi_application()
@@ -10,6 +10,15 @@ from django.db import IntegrityError
 
 logger = logging.getLogger(__name__)
 
+# PostgreSQL SQLSTATE codes for integrity violations -> user-facing messages
+INTEGRITY_ERROR_MESSAGES = {
+    '23505': 'This record already exists. Please check for duplicates.',  # unique_violation
+    '23503': 'Referenced record does not exist.',  # foreign_key_violation
+    '23502': 'A required field is missing.',  # not_null_violation
+    '23514': 'A field value is out of the allowed range.',  # check_violation
+}
+DEFAULT_INTEGRITY_ERROR_MESSAGE = 'Database constraint violation.'
+
 def custom_exception_handler(exc, context):
     """
     Custom exception handler that provides more user-friendly error messages.
@@ -30,11 +39,24 @@ def custom_exception_handler(exc, context):
         
         # Handle specific error types with better messages
         if isinstance(exc, IntegrityError):
-            if 'unique constraint' in str(exc).lower():
-                custom_response_data['message'] = 'This record already exists. Please check for duplicates.'
-            else:
-                custom_response_data['message'] = 'Database constraint violation.'
+            custom_response_data['message'] = get_integrity_error_message(exc)
         
         response.data = custom_response_data
     
-    return response
\ No newline at end of file
+    return response
+
+
+def get_integrity_error_message(exc):
+    """
+    Pick a message for an IntegrityError.
+    Uses the driver's SQLSTATE code when there is one (psycopg2 sets
+    ``pgcode`` on the wrapped error) instead of scanning the error text.
+    """
+    pgcode = getattr(exc.__cause__, 'pgcode', None)
+    if pgcode is not None:
+        return INTEGRITY_ERROR_MESSAGES.get(pgcode, DEFAULT_INTEGRITY_ERROR_MESSAGE)
+    
+    # Backends without SQLSTATE codes (e.g. SQLite) only expose the message text
+    if 'unique constraint' in str(exc).lower():
+        return INTEGRITY_ERROR_MESSAGES['23505']
+    return DEFAULT_INTEGRITY_ERROR_MESSAGE
@@ -0,0 +1,46 @@
+"""
+Shared filter backends for the API viewsets.
+"""
+from django_filters.rest_framework import DjangoFilterBackend
+
+
+class LazyDjangoFilterBackend(DjangoFilterBackend):
+    """
+    DjangoFilterBackend that avoids per-request FilterSet work.
+
+    - Skips building a FilterSet when the request carries none of the
+      view's filter parameters (the common plain-list case).
+    - Generates the FilterSet class for a view's ``filterset_fields`` once
+      per process instead of re-running the FilterSet metaclass (and its
+      filter deep copies) on every request.
+    """
+
+    # (view class, model) -> generated FilterSet class
+    _auto_filterset_classes = {}
+
+    def filter_queryset(self, request, queryset, view):
+        if not self.has_filter_params(request, queryset, view):
+            return queryset
+        return super().filter_queryset(request, queryset, view)
+
+    def has_filter_params(self, request, queryset, view):
+        """Return True if any query parameter names one of the view's filters."""
+        params = request.query_params
+        if not params:
+            return False
+        filterset_class = self.get_filterset_class(view, queryset)
+        if filterset_class is None:
+            return False
+        return any(name in params for name in filterset_class.base_filters)
+
+    def get_filterset_class(self, view, queryset=None):
+        # Explicit filterset classes are already built once at import time
+        if getattr(view, 'filterset_class', None) or queryset is None:
+            return super().get_filterset_class(view, queryset)
+
+        key = (type(view), queryset.model)
+        filterset_class = self._auto_filterset_classes.get(key)
+        if filterset_class is None:
+            filterset_class = super().get_filterset_class(view, queryset)
+            self._auto_filterset_classes[key] = filterset_class
+        return filterset_class
@@ -10,6 +10,13 @@ import time
 
 logger = logging.getLogger(__name__)
 
+# Only API traffic is rate limited; admin, static files, docs and pages pass straight through
+API_PREFIX = '/api/'
+
+# Rate limits are counted over a sliding window of this many seconds
+RATE_LIMIT_WINDOW = 3600
+
+
 class RateLimitMiddleware:
     """
     Middleware to implement rate limiting across the entire application.
@@ -20,6 +27,10 @@ class RateLimitMiddleware:
         self.get_response = get_response
         
     def __call__(self, request):
+        # Fast path: non-API requests skip the rate limit (and the cache) entirely
+        if not request.path.startswith(API_PREFIX):
+            return self.get_response(request)
+        
         # Check rate limit before processing request
         if self.is_rate_limited(request):
             return JsonResponse({
@@ -35,18 +46,10 @@ class RateLimitMiddleware:
         """
         Check if the current request should be rate limited.
         """
-        # Skip rate limiting for admin and static files
-        if request.path.startswith('/admin/') or request.path.startswith('/static/'):
+        if not request.path.startswith(API_PREFIX):
             return False
-            
-        # Get client IP address
-        ip = self.get_client_ip(request)
-        
-        # Different limits for different endpoints
-        if request.path.startswith('/api/'):
-            return self.check_api_rate_limit(ip, request)
         
-        return False
+        return self.check_api_rate_limit(self.get_client_ip(request), request)
     
     def get_client_ip(self, request):
         """Get the real IP address of the client."""
@@ -72,13 +75,51 @@ class RateLimitMiddleware:
             limit_key = f'api_rate_limit_anon_{ip}'
             max_requests = 50   # per hour
         
-        # Check current count
-        current_count = cache.get(limit_key, 0)
+        # Sliding window: count this request in the current fixed window, then add
+        # the previous window weighted by how much of it still overlaps the last hour.
+        # This stops a client doubling its limit by bursting across a window boundary.
+        now = time.time()
+        current_count, previous_count = self.count_request(limit_key, int(now // RATE_LIMIT_WINDOW))
+        overlap = 1 - (now % RATE_LIMIT_WINDOW) / RATE_LIMIT_WINDOW
+        current_count += previous_count * overlap
         
-        if current_count >= max_requests:
-            logger.warning(f'Rate limit exceeded for {ip} - {current_count} requests')
+        if current_count > max_requests:
+            logger.warning(f'Rate limit exceeded for {ip} - {current_count:.0f} requests')
             return True
         
-        # Increment counter (expires in 1 hour)
-        cache.set(limit_key, current_count + 1, 3600)
-        return False
\ No newline at end of file
+        return False
+    
+    def count_request(self, limit_key, window):
+        """
+        Count one request in the current window and return (current, previous) window counts.
+        On a django-redis cache this is one pipelined round trip (INCR + EXPIRE + GET);
+        other backends take two (incr, then get of the previous window).
+        """
+        current_key = f'{limit_key}_{window}'
+        previous_key = f'{limit_key}_{window - 1}'
+        # Only django-redis caches have delete_pattern; the import is optional for the same reason
+        if hasattr(cache, 'delete_pattern'):
+            from django_redis import get_redis_connection
+            
+            pipe = get_redis_connection('default').pipeline(transaction=False)
+            current_redis_key = cache.make_key(current_key)
+            pipe.incr(current_redis_key)
+            # Kept for two windows so the next window can still read it
+            pipe.expire(current_redis_key, RATE_LIMIT_WINDOW * 2)
+            pipe.get(cache.make_key(previous_key))
+            current_count, _, previous_count = pipe.execute()
+            # django-redis stores integers unpickled, so the raw value parses directly
+            return current_count, int(previous_count or 0)
+        
+        return self.increment_window(current_key), cache.get(previous_key, 0)
+    
+    def increment_window(self, window_key):
+        """Atomically count one request in a window and return the new total."""
+        try:
+            return cache.incr(window_key)
+        except ValueError:
+            # First request in this window; add() only succeeds for one racer.
+            # Keep it for two windows so the next window can still read it.
+            if cache.add(window_key, 1, RATE_LIMIT_WINDOW * 2):
+                return 1
+            return cache.incr(window_key)
@@ -113,6 +113,13 @@ CACHES = {
 }
 
 
+# Audit log entries are written by a background thread in batches when True.
+# wsgi.py/asgi.py turn it on for the web server; everything else (migrate, shell,
+# seed_data, tests) defaults to writing synchronously, so a short-lived process
+# never exits with entries still queued.
+AUDIT_LOG_ASYNC = env.bool('AUDIT_LOG_ASYNC', default=False)
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -0,0 +1,24 @@
+"""
+Test settings that run the suite against an in-memory SQLite database.
+
+The tests only exercise ORM behaviour and API routing, so they don't need
+the PostgreSQL server from DATABASE_URL; an in-memory database skips the
+socket round trips and the fsync on every commit. The PostgreSQL-only code
+paths (views, partitions, COPY) are skipped here, so CI still runs the
+suite with the default settings.
+
+    pytest --ds=employee_project.test_settings_inmem
+"""
+import os
+
+# settings.py reads DATABASE_URL when it is imported; it is replaced below anyway
+os.environ.setdefault('DATABASE_URL', 'sqlite://:memory:')
+
+from .settings import *  # noqa: E402,F401,F403
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    },
+}
@@ -5,6 +5,7 @@ from drf_yasg.views import get_schema_view  # Swagger schema view
 from drf_yasg import openapi  # OpenAPI info
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView  # JWT views
 from employees.health import health_check, detailed_health_check, readiness_check, liveness_check
+from attendance.urls import urlpatterns as attendance_patterns
 
 
 # Swagger Schema Configuration
@@ -25,11 +26,11 @@ urlpatterns = [
     
     # Versioned API endpoints
     path('api/v1/employees/', include('employees.urls')),  # Employee & Department API endpoints v1
-    path('api/v1/attendance/', include('attendance.urls')),  # Attendance & Performance API endpoints v1
+    path('api/v1/attendance/', include(attendance_patterns)),  # Attendance & Performance API endpoints v1
     
     # Backward compatibility (redirect to v1)
     path('api/employees/', include('employees.urls')),  # Backward compatible
-    path('api/attendance/', include('attendance.urls')),  # Backward compatible
+    path('api/attendance/', include(attendance_patterns)),  # Backward compatible
 
     # JWT endpoints (versioned)
     path('api/v1/auth/token/', TokenObtainPairView.as_view(), name='token_obtain_pair_v1'),
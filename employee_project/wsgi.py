@@ -13,5 +13,7 @@ import os
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'employee_project.settings')
+# Serving requests: write audit entries on the background thread (unless set explicitly)
+os.environ.setdefault('AUDIT_LOG_ASYNC', 'True')
 
 application = get_wsgi_application()
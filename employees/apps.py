@@ -1,6 +1,30 @@
-from django.apps import AppConfig
+from django.apps import AppConfig, apps
+from django.conf import settings
 
 
 class EmployeesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'employees'
+
+    def ready(self):
+        from django.db.models.signals import post_save, post_delete
+        from .audit import _AUDITED, audit_post_save, audit_post_delete, start_log_listener
+
+        # One receiver per audited model instead of a catch-all receiver that filters by name
+        for label in _AUDITED:
+            model = apps.get_model(label)
+            post_save.connect(audit_post_save, sender=model, dispatch_uid=f'audit_save_{label}')
+            post_delete.connect(audit_post_delete, sender=model, dispatch_uid=f'audit_delete_{label}')
+
+        from .models import Employee
+        from .signals import employee_count_post_save, employee_count_post_delete
+
+        post_save.connect(employee_count_post_save, sender=Employee, dispatch_uid='employee_count_save')
+        post_delete.connect(employee_count_post_delete, sender=Employee, dispatch_uid='employee_count_delete')
+
+        # Only the web server audits asynchronously (see AUDIT_LOG_ASYNC), so
+        # management commands and tests don't start the log thread; the audit
+        # writer thread itself starts on the first queued entry.
+        # LOGGING is configured before ready(), so the audit handlers exist by now
+        if settings.AUDIT_LOG_ASYNC:
+            start_log_listener()
@@ -2,16 +2,35 @@
 Audit logging system for tracking all changes to important data.
 This creates a permanent record of who did what and when.
 """
+import atexit
 import json
 import logging
-from django.db import models
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from contextvars import ContextVar
+from functools import partial
+from typing import Optional
+from django.conf import settings
+from django.db import models, transaction
 from django.contrib.auth.models import User
 from django.utils import timezone
-from django.db.models.signals import post_save, post_delete
-from django.dispatch import receiver
+from django.http import HttpRequest
+
+from . import audit_worker
 
 logger = logging.getLogger('audit')
 
+# The request being handled, so signal handlers can attribute changes to it.
+# A ContextVar (not a thread attribute) keeps it isolated per request under ASGI and reused worker threads.
+_current_request: ContextVar[Optional[HttpRequest]] = ContextVar('audit_request', default=None)
+
+# Requests under these paths never produce audit events (static files, probes)
+_SKIP_PREFIXES = ('/static/', '/media/', '/health/', '/favicon.ico')
+
+# Shared default for entries without changes, instead of a new dict per event.
+# Never mutated: JSONField only serializes it.
+_EMPTY = {}
+
 
 class AuditLog(models.Model):
     """
@@ -38,8 +57,8 @@ class AuditLog(models.Model):
     user_ip = models.GenericIPAddressField(null=True, blank=True)
     user_agent = models.TextField(blank=True, help_text="Browser/client information")
     
-    # When it happened
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # When it happened (set when the event is queued, not when the worker writes it)
+    timestamp = models.DateTimeField(default=timezone.now, editable=False)
     
     # What changed (stored as JSON)
     changes = models.JSONField(default=dict, help_text="Details of what changed")
@@ -48,11 +67,16 @@ class AuditLog(models.Model):
     notes = models.TextField(blank=True, help_text="Additional context or notes")
 
     class Meta:
+        # On PostgreSQL the table is range-partitioned by month on timestamp
+        # (migration 0009; `manage.py create_audit_partitions` adds new months).
+        # There the database primary key is (id, timestamp), as partitioning
+        # requires; id alone stays unique, being drawn from one sequence.
         ordering = ['-timestamp']
+        # Object and user history are read newest first, so the index supplies the order
         indexes = [
             models.Index(fields=['action', 'timestamp']),
-            models.Index(fields=['model_name', 'object_id']),
-            models.Index(fields=['user', 'timestamp']),
+            models.Index(fields=['model_name', 'object_id', '-timestamp'], name='audit_obj_time_idx'),
+            models.Index(fields=['user', '-timestamp'], name='audit_user_time_idx'),
         ]
 
     def __str__(self):
@@ -62,6 +86,9 @@ class AuditLog(models.Model):
 def log_audit_event(action, instance, user=None, request=None, changes=None, notes=""):
     """
     Helper function to create audit log entries.
+    The entry is handed to the background audit writer when the surrounding
+    transaction commits, so the request doesn't wait on the INSERT; it's
+    written synchronously only if the queue is unavailable or full.
     
     Args:
         action: What happened (CREATE, UPDATE, DELETE, etc.)
@@ -70,6 +97,9 @@ def log_audit_event(action, instance, user=None, request=None, changes=None, not
         request: HTTP request object (for IP and user agent)
         changes: Dictionary of what changed
         notes: Additional context
+    
+    Returns:
+        The saved AuditLog when written synchronously, otherwise None.
     """
     try:
         # Get user info from request if not provided
@@ -85,24 +115,33 @@ def log_audit_event(action, instance, user=None, request=None, changes=None, not
             user_ip = get_client_ip(request)
             user_agent = request.META.get('HTTP_USER_AGENT', '')[:500]  # Limit length
         
-        # Create audit log entry
-        audit_entry = AuditLog.objects.create(
-            action=action,
-            model_name=instance.__class__.__name__,
-            object_id=str(instance.pk),
-            object_repr=str(instance)[:200],  # Limit length
-            user=user,
-            user_ip=user_ip,
-            user_agent=user_agent,
-            changes=changes or {},
-            notes=notes
-        )
+        # Plain field values, so the worker thread never touches request objects
+        entry = {
+            'action': action,
+            'model_name': instance.__class__.__name__,
+            'object_id': str(instance.pk),
+            'object_repr': str(instance)[:200],  # Limit length
+            'user_id': user.pk if user else None,
+            'user_ip': user_ip,
+            'user_agent': user_agent,
+            'changes': changes if changes is not None else _EMPTY,
+            'notes': notes,
+            'timestamp': timezone.now(),
+        }
         
-        # Also log to file
+        audit_entry = None
+        if settings.AUDIT_LOG_ASYNC:
+            # Only once the change is committed: a rolled-back save leaves no entry,
+            # and the worker never writes ahead of the row it describes
+            transaction.on_commit(partial(_enqueue_or_write, entry))
+        else:
+            audit_entry = AuditLog.objects.create(**entry)
+        
+        # Also log to file (lazy %-args: nothing is formatted if INFO is filtered out)
         logger.info(
-            f"AUDIT: {action} {instance.__class__.__name__}({instance.pk}) "
-            f"by {user.username if user else 'Anonymous'} "
-            f"from {user_ip or 'Unknown IP'}"
+            "AUDIT: %s %s(%s) by %s from %s",
+            action, entry['model_name'], entry['object_id'],
+            user.username if user else 'Anonymous', user_ip or 'Unknown IP',
         )
         
         return audit_entry
@@ -113,13 +152,57 @@ def log_audit_event(action, instance, user=None, request=None, changes=None, not
         return None
 
 
+def _enqueue_or_write(entry):
+    """Hand a committed change's entry to the worker, or write it now if the queue can't take it."""
+    if not audit_worker.enqueue(entry):
+        # Worker not running or queue full: write it now rather than drop it
+        try:
+            AuditLog.objects.create(**entry)
+        except Exception as e:
+            logger.error(f"Failed to create audit log: {e}")
+
+
+_log_listener = None
+
+
+def start_log_listener():
+    """
+    Put the 'audit' logger's configured handlers behind a QueueHandler.
+    A QueueListener thread does the file/console writes, so logging an audit
+    event from a request only costs a queue put.
+    """
+    global _log_listener
+    if _log_listener is not None or not logger.handlers:
+        return
+    
+    handlers = logger.handlers[:]
+    for handler in handlers:
+        logger.removeHandler(handler)
+    
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    _log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _log_listener.start()
+    # Flush pending records on shutdown
+    atexit.register(_log_listener.stop)
+
+
 def get_client_ip(request):
-    """Get the real IP address of the client."""
+    """
+    Get the real IP address of the client.
+    Resolved once per request (the middleware and every audit signal ask for it).
+    """
+    ip = getattr(request, '_cached_ip', None)
+    if ip is not None:
+        return ip
+    
     x_forwarded_for = request.META.get('HTTP_X_FORWARDED_FOR')
     if x_forwarded_for:
-        ip = x_forwarded_for.split(',')[0]
+        # First hop only; partition doesn't build a list of every proxy
+        ip = x_forwarded_for.partition(',')[0].strip()
     else:
         ip = request.META.get('REMOTE_ADDR')
+    request._cached_ip = ip
     return ip
 
 
@@ -134,12 +217,16 @@ class AuditMiddleware:
         self.get_response = get_response
 
     def __call__(self, request):
-        # Store request in thread local storage so signal handlers can access it
-        import threading
-        if not hasattr(threading.current_thread(), 'request'):
-            threading.current_thread().request = request
-            
-        response = self.get_response(request)
+        # Probe and static traffic: skip the ContextVar and logging work entirely
+        if request.path.startswith(_SKIP_PREFIXES):
+            return self.get_response(request)
+        
+        # Expose the request to signal handlers for the duration of this request only
+        token = _current_request.set(request)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current_request.reset(token)
         
         # Log significant API actions
         if request.path.startswith('/api/') and request.method in ['POST', 'PUT', 'PATCH', 'DELETE']:
@@ -154,45 +241,45 @@ class AuditMiddleware:
         return response
 
 
-# Signal handlers for automatic audit logging
-@receiver(post_save)
+# Models whose saves and deletes are audited (app_label.ModelName)
+_AUDITED = frozenset((
+    'employees.Employee',
+    'employees.Department',
+    'attendance.Attendance',
+    'attendance.Performance',
+))
+
+
+# Signal handlers for automatic audit logging.
+# Connected per _AUDITED model in EmployeesConfig.ready(), so saves of other
+# models (sessions, users, admin log, ...) never reach them.
 def audit_post_save(sender, instance, created, **kwargs):
     """Automatically log when objects are created or updated."""
-    # Only audit specific models
-    audited_models = ['Employee', 'Department', 'Attendance', 'Performance']
+    request = _current_request.get()
     
-    if sender.__name__ in audited_models:
-        import threading
-        request = getattr(threading.current_thread(), 'request', None)
-        
-        action = 'CREATE' if created else 'UPDATE'
-        changes = {}
-        
-        # For updates, try to get the changes
-        if not created and hasattr(instance, 'get_dirty_fields'):
-            changes = instance.get_dirty_fields()
-        
-        log_audit_event(
-            action=action,
-            instance=instance,
-            request=request,
-            changes=changes,
-            notes=f"Auto-logged {action.lower()}"
-        )
+    action = 'CREATE' if created else 'UPDATE'
+    changes = None
+    
+    # For updates, try to get the changes
+    if not created and hasattr(instance, 'get_dirty_fields'):
+        changes = instance.get_dirty_fields()
+    
+    log_audit_event(
+        action=action,
+        instance=instance,
+        request=request,
+        changes=changes,
+        notes=f"Auto-logged {action.lower()}"
+    )
 
 
-@receiver(post_delete)
 def audit_post_delete(sender, instance, **kwargs):
     """Automatically log when objects are deleted."""
-    audited_models = ['Employee', 'Department', 'Attendance', 'Performance']
+    request = _current_request.get()
     
-    if sender.__name__ in audited_models:
-        import threading
-        request = getattr(threading.current_thread(), 'request', None)
-        
-        log_audit_event(
-            action='DELETE',
-            instance=instance,
-            request=request,
-            notes="Auto-logged deletion"
-        )
\ No newline at end of file
+    log_audit_event(
+        action='DELETE',
+        instance=instance,
+        request=request,
+        notes="Auto-logged deletion"
+    )
\ No newline at end of file
@@ -0,0 +1,131 @@
+"""
+Background writer for audit log entries.
+Signal handlers queue plain dicts here once their transaction commits, so
+the request never waits on the audit INSERT; a daemon thread saves them in
+batches with bulk_create.
+"""
+import atexit
+import logging
+import queue
+import threading
+import time
+
+from django.db import close_old_connections, transaction
+
+logger = logging.getLogger('audit')
+
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 1.0  # seconds a partial batch may wait before it is written
+GET_TIMEOUT = 0.1  # seconds
+
+_audit_queue = queue.Queue(maxsize=10000)
+_worker = None
+_worker_lock = threading.Lock()
+_STOP = object()
+
+
+def enqueue(entry):
+    """
+    Queue an audit entry (a dict of AuditLog field values), starting the
+    worker on first use so only processes that actually audit (the web
+    server, not migrate or shell) get the thread.
+    Returns False if the caller has to write it synchronously instead:
+    the queue is full.
+    """
+    if _worker is None or not _worker.is_alive():
+        start()
+    try:
+        _audit_queue.put_nowait(entry)
+    except queue.Full:
+        return False
+    return True
+
+
+def start():
+    """Start the worker thread (once per process; again in a forked child, where it didn't survive)."""
+    global _worker
+    with _worker_lock:
+        if _worker is not None and _worker.is_alive():
+            return
+        if _worker is None:
+            # Write whatever is still queued when the process exits
+            atexit.register(stop)
+        _worker = threading.Thread(target=_run, name='audit-writer', daemon=True)
+        _worker.start()
+
+
+def stop(timeout=5):
+    """
+    Stop the worker thread and make sure every queued entry is written.
+    The worker gets timeout seconds to finish its batch; anything still
+    queued after that (worker dead or stuck) is written here, so exiting
+    never depends on the daemon thread getting through the queue in time.
+    """
+    if _worker is not None and _worker.is_alive():
+        _audit_queue.put(_STOP)
+        _worker.join(timeout)
+    _drain()
+
+
+def _drain():
+    """Write everything left in the queue from the calling thread."""
+    batch = []
+    while True:
+        try:
+            entry = _audit_queue.get_nowait()
+        except queue.Empty:
+            break
+        if entry is not _STOP:
+            batch.append(entry)
+    for start_at in range(0, len(batch), BATCH_SIZE):
+        _flush(batch[start_at:start_at + BATCH_SIZE])
+
+
+def _run():
+    batch = []
+    deadline = None
+    while True:
+        try:
+            entry = _audit_queue.get(timeout=GET_TIMEOUT)
+        except queue.Empty:
+            entry = None
+
+        if entry is _STOP:
+            _flush(batch)
+            return
+        if entry is not None:
+            if not batch:
+                deadline = time.monotonic() + FLUSH_INTERVAL
+            batch.append(entry)
+
+        if batch and (len(batch) >= BATCH_SIZE or time.monotonic() >= deadline):
+            _flush(batch)
+            batch = []
+
+
+def _flush(batch):
+    if not batch:
+        return
+    # Imported here: audit.py imports this module
+    from .audit import AuditLog
+
+    # This thread holds its own connection; drop it if it went stale between batches
+    close_old_connections()
+    try:
+        # In its own atomic block so a failure leaves the connection usable for the retries
+        with transaction.atomic():
+            AuditLog.objects.bulk_create(
+                [AuditLog(**entry) for entry in batch],
+                batch_size=BATCH_SIZE,
+                ignore_conflicts=True,
+            )
+    except Exception as e:
+        # Don't let a bad batch kill the worker, or one bad entry lose the rest:
+        # write them one by one so only the failing ones are dropped
+        logger.warning(f"Batch write of {len(batch)} audit log entries failed ({e}); retrying one by one")
+        for entry in batch:
+            try:
+                with transaction.atomic():
+                    AuditLog.objects.create(**entry)
+            except Exception as e:
+                logger.error(f"Failed to write audit log entry {entry['action']} {entry['model_name']}({entry['object_id']}): {e}")
@@ -0,0 +1,90 @@
+"""
+Management command to create upcoming monthly AuditLog partitions.
+Run this from cron (e.g. daily or monthly) so new audit rows always land in
+a monthly partition instead of the DEFAULT one. Months that already have
+rows in DEFAULT (a missed run) get those rows moved into the new partition.
+"""
+from datetime import date
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from employees.audit import AuditLog
+
+
+class Command(BaseCommand):
+    help = 'Create monthly partitions of the audit log table ahead of time (PostgreSQL only)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--months', type=int, default=3, help='Months ahead to create (default 3)')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            self.stdout.write(
+                self.style.WARNING(
+                    f'Audit log partitioning requires PostgreSQL (current backend: {connection.vendor}). '
+                    'The audit log is a plain table here.'
+                )
+            )
+            return
+
+        table = AuditLog._meta.db_table
+        default = f'{table}_default'
+        today = date.today()
+        year, month = today.year, today.month
+        created = []
+        moved = 0
+        with connection.cursor() as cursor:
+            for _ in range(options['months'] + 1):
+                start = date(year, month, 1)
+                year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+                end = date(year, month, 1)
+
+                partition = f'{table}_y{start:%Y}m{start:%m}'
+                cursor.execute("SELECT to_regclass(%s)", [partition])
+                if cursor.fetchone()[0] is not None:
+                    created.append(partition)
+                    continue
+                with transaction.atomic():
+                    moved += self.create_partition(cursor, table, default, partition, start, end)
+                created.append(partition)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Audit log partitions ready: {', '.join(created)}")
+        )
+        if moved:
+            self.stdout.write(f"Moved {moved} audit rows out of the DEFAULT partition")
+
+    def create_partition(self, cursor, table, default, partition, start, end):
+        """
+        Create one monthly partition and return how many rows it took over from DEFAULT.
+
+        PostgreSQL refuses to attach a range while DEFAULT holds rows inside it
+        (e.g. after a missed cron run), so in that case DEFAULT is detached, the
+        month's rows are moved into the new partition, and DEFAULT is reattached.
+        """
+        bounds = [start.isoformat(), end.isoformat()]
+        cursor.execute(
+            f'SELECT EXISTS (SELECT 1 FROM {default} WHERE "timestamp" >= %s AND "timestamp" < %s)',
+            bounds,
+        )
+        if not cursor.fetchone()[0]:
+            cursor.execute(
+                f"CREATE TABLE {partition} PARTITION OF {table} FOR VALUES FROM (%s) TO (%s)",
+                bounds,
+            )
+            return 0
+
+        cursor.execute(f"ALTER TABLE {table} DETACH PARTITION {default}")
+        cursor.execute(
+            f"CREATE TABLE {partition} PARTITION OF {table} FOR VALUES FROM (%s) TO (%s)",
+            bounds,
+        )
+        cursor.execute(
+            f'WITH moved AS (DELETE FROM {default} WHERE "timestamp" >= %s AND "timestamp" < %s RETURNING *) '
+            f"INSERT INTO {partition} SELECT * FROM moved",
+            bounds,
+        )
+        moved = cursor.rowcount
+        cursor.execute(f"ALTER TABLE {table} ATTACH PARTITION {default} DEFAULT")
+        return moved
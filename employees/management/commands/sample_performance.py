@@ -0,0 +1,32 @@
+"""
+Management command that records the database timing sample read by the
+health check. Run it as a long-lived process next to the web server, or
+from cron with --once (samples are kept PERF_SAMPLE_TIMEOUT seconds).
+"""
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from employees.health import PERF_SAMPLE_INTERVAL, record_perf_sample
+
+
+class Command(BaseCommand):
+    help = 'Record database timing samples for the health check'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--interval', type=int, default=PERF_SAMPLE_INTERVAL,
+            help=f'Seconds between samples (default {PERF_SAMPLE_INTERVAL})',
+        )
+        parser.add_argument('--once', action='store_true', help='Record one sample and exit')
+
+    def handle(self, *args, **options):
+        while True:
+            sample = record_perf_sample()
+            self.stdout.write(f"Database sample: {sample['db_ms']} ms")
+            if options['once']:
+                return
+            # Long-lived: drop the connection if it went stale between samples
+            close_old_connections()
+            time.sleep(options['interval'])
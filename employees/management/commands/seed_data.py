@@ -1,13 +1,32 @@
 # employees/management/commands/seed_data.py
+import io
+
 from django.core.management.base import BaseCommand
+from django.db import connection
 from django.utils import timezone
 from faker import Faker
-from random import choice, randint, random
+from random import choices, randint
 from datetime import timedelta, date
+from itertools import islice, repeat
 
 from employees.models import Department, Employee
+from attendance import list_cache
 from attendance.models import Attendance, Performance
 
+# Rows per bulk_create call; generated lazily so peak memory stays at one chunk
+BATCH_SIZE = 10000
+
+# Weighted attendance status: mostly Present
+STATUSES = ["Present", "Late", "Absent"]
+STATUS_WEIGHTS = [88, 7, 5]
+
+REVIEW_COUNTS = (1, 2, 3)  # reviews per employee
+RATINGS = (1, 2, 3, 4, 5)
+
+# Also refreshed when an upsert hits an existing row: brings back rows that
+# --wipe (a soft delete) marked deleted
+REVIVE_FIELDS = ['updated_at', 'deleted', 'deleted_by_cascade']
+
 class Command(BaseCommand):
     help = "Seed database with departments, employees, attendance, and performance."
 
@@ -16,7 +35,7 @@ class Command(BaseCommand):
         parser.add_argument('--employees', type=int, default=50, help='Number of employees (default 50)')
         # How many past days to generate attendance for
         parser.add_argument('--days', type=int, default=60, help='Days of attendance to create (default 60)')
-        # Wipe existing data first?
+        # Wipe existing data first? Rarely needed: re-seeding updates the rows it created before
         parser.add_argument('--wipe', action='store_true', help='Delete existing data before seeding')
 
     def handle(self, *args, **options):
@@ -32,78 +51,158 @@ class Command(BaseCommand):
             Employee.objects.all().delete()
             Department.objects.all().delete()
 
-        # Create baseline departments if none
+        # Baseline departments; upserted so re-runs (and runs after --wipe) don't collide on name
         dept_names = [
             "Engineering", "Human Resources", "Sales", "Marketing",
             "Finance", "Operations", "IT", "Customer Support"
         ]
-        if Department.objects.count() == 0:
-            Department.objects.bulk_create([Department(name=n) for n in dept_names])
+        Department.objects.bulk_create(
+            [Department(name=n) for n in dept_names],
+            update_conflicts=True, unique_fields=['name'], update_fields=REVIVE_FIELDS,
+        )
 
-        departments = list(Department.objects.all())
+        dept_ids = list(Department.objects.values_list('pk', flat=True))
 
         self.stdout.write("Creating employees...")
+        # Unique by construction, so no faker.unique retry set; deterministic, so a
+        # re-run upserts the same employees instead of adding new ones
+        emails = [f"user{i:07d}@example.com" for i in range(num_employees)]
+        employee_dept_ids = choices(dept_ids, k=num_employees)
+        today = timezone.now().date()
         employees = []
-        for _ in range(num_employees):
-            doj = timezone.now().date() - timedelta(days=randint(30, 5 * 365))  # joined sometime in last 5 years
+        for email, dept_id in zip(emails, employee_dept_ids):
+            doj = today - timedelta(days=randint(30, 5 * 365))  # joined sometime in last 5 years
             emp = Employee(
                 name=faker.name(),
-                email=faker.unique.email(),  # unique to avoid collisions
-                phone_number=faker.numerify('###-###-####'),
+                email=email,
+                phone_number=f"{randint(100, 999)}-{randint(100, 999)}-{randint(1000, 9999)}",
                 address=faker.address().replace('\n', ', '),
                 date_of_joining=doj,
-                department=choice(departments),
+                department_id=dept_id,
             )
             employees.append(emp)
-        Employee.objects.bulk_create(employees)
-        employees = list(Employee.objects.all())  # refresh with IDs
+        # PostgreSQL and SQLite both return the primary keys (inserted or updated), so no re-query
+        employees = Employee.objects.bulk_create(
+            employees,
+            update_conflicts=True,
+            unique_fields=['email'],
+            update_fields=['name', 'phone_number', 'address', 'department', 'date_of_joining', *REVIVE_FIELDS],
+        )
+        # bulk_create skips the signals that maintain the counter
+        Department.refresh_employee_counts(dept_ids)
 
         self.stdout.write("Creating attendance records...")
-        attendance_bulk = []
-        today = timezone.now().date()
-        for emp in employees:
-            # Generate attendance for past N days (skip weekends ~ simple rule)
-            for d in range(days):
-                day = today - timedelta(days=d)
-                if day.weekday() >= 5:  # 5=Sat, 6=Sun
-                    continue  # skip weekends
-
-                # Weighted status: mostly Present
-                r = random()
-                if r < 0.88:
-                    status = "Present"
-                elif r < 0.95:
-                    status = "Late"
-                else:
-                    status = "Absent"
-
-                attendance_bulk.append(
-                    Attendance(employee=emp, date=day, status=status)
-                )
-        Attendance.objects.bulk_create(attendance_bulk, batch_size=2000)
+        # Attendance for past N days, skipping weekends (5=Sat, 6=Sun); same dates for everyone
+        # Formatted once as ISO strings: every employee shares this date column
+        weekdays = [
+            day.isoformat() for day in (today - timedelta(days=d) for d in range(days))
+            if day.weekday() < 5
+        ]
+
+        def gen_attendance():
+            # Column-wise per employee (id, shared dates, sampled statuses) zipped into
+            # row tuples in C; no Attendance objects or per-row Python loop on the COPY path
+            for emp in employees:
+                statuses = choices(STATUSES, weights=STATUS_WEIGHTS, k=len(weekdays))
+                yield from zip(repeat(emp.pk, len(weekdays)), weekdays, statuses)
+
+        attendance_created = self.load_rows(
+            Attendance, ('employee_id', 'date', 'status'), gen_attendance(),
+            unique_fields=('employee_id', 'date'), update_fields=('status',),
+        )
 
         self.stdout.write("Creating performance reviews...")
-        performance_bulk = []
-        for emp in employees:
-            # 1–3 reviews spread after date_of_joining
-            reviews = randint(1, 3)
-            for _ in range(reviews):
-                start = emp.date_of_joining
-                if start >= today:
+
+        def gen_performance():
+            # Day arithmetic on plain ordinals; review counts drawn for everyone in one call
+            today_ord = today.toordinal()
+            review_counts = choices(REVIEW_COUNTS, k=len(employees))
+            for emp, review_count in zip(employees, review_counts):
+                start = emp.date_of_joining.toordinal()
+                if start >= today_ord:
                     continue
-                review_day = start + timedelta(days=randint(30, max(31, (today - start).days)))
-                review_day = min(review_day, today)
-                performance_bulk.append(
-                    Performance(
-                        employee=emp,
-                        rating=randint(1, 5),
-                        review_date=review_day
-                    )
-                )
-        Performance.objects.bulk_create(performance_bulk)
+                # 1–3 reviews spread after date_of_joining, at most one per day, never after today
+                span = max(31, today_ord - start)
+                review_ords = {min(start + randint(30, span), today_ord) for _ in range(review_count)}
+                ratings = choices(RATINGS, k=len(review_ords))
+                yield from zip(repeat(emp.pk), ratings, map(date.fromordinal, review_ords))
+
+        performance_created = self.load_rows(
+            Performance, ('employee_id', 'rating', 'review_date'), gen_performance(),
+            unique_fields=('employee_id', 'review_date'), update_fields=('rating',),
+        )
 
+        # The upserts skip post_save, so expire the cached list pages here
+        list_cache.invalidate(list_cache.ATTENDANCE_PREFIX)
+        list_cache.invalidate(list_cache.PERFORMANCE_PREFIX)
+
+        # Counted while writing, so no COUNT(*) over the freshly loaded tables
         self.stdout.write(self.style.SUCCESS(
             f"Seeding complete: {len(employees)} employees, "
-            f"{Attendance.objects.count()} attendance rows, "
-            f"{Performance.objects.count()} performance rows."
+            f"{attendance_created} attendance rows, "
+            f"{performance_created} performance rows written."
         ))
+
+    def load_rows(self, model, columns, rows, unique_fields, update_fields):
+        """
+        Upsert an iterator of value tuples for columns: rows that clash on
+        unique_fields get update_fields refreshed (and are undeleted) instead of
+        failing. Returns how many rows were written.
+        """
+        update_fields = (*update_fields, *REVIVE_FIELDS)
+        if connection.vendor == 'postgresql':
+            return self.copy_rows(model, columns, rows, unique_fields, update_fields)
+        # SQLite (tests, local dev): bulk_create upserts
+        instances = (model(**dict(zip(columns, row))) for row in rows)
+        return self.bulk_create_in_chunks(model, instances, unique_fields, update_fields)
+
+    def copy_rows(self, model, columns, rows, unique_fields, update_fields):
+        """
+        Load rows with PostgreSQL COPY ... FROM STDIN, BATCH_SIZE rows per COPY.
+        Much faster than multi-row INSERTs for large seeds. COPY can't handle
+        conflicts, so each chunk goes to a temp table and is upserted from there.
+        """
+        # COPY skips Django's field defaults, so fill the ones bulk_create would
+        now = timezone.now().isoformat()
+        columns = (*columns, 'created_at', 'updated_at', 'deleted_by_cascade')
+        defaults = (now, now, 'f')
+
+        quote = connection.ops.quote_name
+        table = quote(model._meta.db_table)
+        column_list = ', '.join(quote(c) for c in columns)
+        stage = quote(f'{model._meta.db_table}_seed')
+        upsert_sql = (
+            f"INSERT INTO {table} ({column_list}) SELECT {column_list} FROM {stage} "
+            f"ON CONFLICT ({', '.join(quote(c) for c in unique_fields)}) DO UPDATE SET "
+            + ', '.join(f'{quote(c)} = EXCLUDED.{quote(c)}' for c in update_fields)
+        )
+        written = 0
+        with connection.cursor() as cursor:
+            cursor.execute(f"CREATE TEMP TABLE {stage} AS SELECT {column_list} FROM {table} WITH NO DATA")
+            try:
+                while chunk := list(islice(rows, BATCH_SIZE)):
+                    # Tab-separated text format; seed values never contain tabs or newlines
+                    buffer = io.StringIO(''.join(
+                        '\t'.join(map(str, (*row, *defaults))) + '\n' for row in chunk
+                    ))
+                    cursor.copy_expert(f"COPY {stage} ({column_list}) FROM STDIN", buffer)
+                    cursor.execute(upsert_sql)
+                    cursor.execute(f"TRUNCATE {stage}")
+                    written += len(chunk)
+            finally:
+                cursor.execute(f"DROP TABLE {stage}")
+        return written
+
+    def bulk_create_in_chunks(self, model, rows, unique_fields, update_fields):
+        """Upsert rows from an iterator BATCH_SIZE at a time; returns how many were written."""
+        written = 0
+        while chunk := list(islice(rows, BATCH_SIZE)):
+            model.objects.bulk_create(
+                chunk,
+                batch_size=BATCH_SIZE,
+                update_conflicts=True,
+                unique_fields=unique_fields,
+                update_fields=update_fields,
+            )
+            written += len(chunk)
+        return written
@@ -0,0 +1,240 @@
+# Generated by Django 5.2.4 on 2026-10-14 05:34
+
+import django.core.validators
+import django.db.models.deletion
+import employees.models
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0004_auto_20250812_2057"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AuditLog",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "action",
+                    models.CharField(
+                        choices=[
+                            ("CREATE", "Created"),
+                            ("UPDATE", "Updated"),
+                            ("DELETE", "Deleted"),
+                            ("LOGIN", "User Login"),
+                            ("LOGOUT", "User Logout"),
+                            ("VIEW", "Viewed"),
+                        ],
+                        max_length=10,
+                    ),
+                ),
+                ("model_name", models.CharField(help_text="Name of the model that was changed", max_length=100)),
+                ("object_id", models.CharField(help_text="ID of the object that was changed", max_length=100)),
+                ("object_repr", models.CharField(help_text="String representation of the object", max_length=200)),
+                ("user_ip", models.GenericIPAddressField(blank=True, null=True)),
+                ("user_agent", models.TextField(blank=True, help_text="Browser/client information")),
+                ("timestamp", models.DateTimeField(auto_now_add=True)),
+                ("changes", models.JSONField(default=dict, help_text="Details of what changed")),
+                ("notes", models.TextField(blank=True, help_text="Additional context or notes")),
+            ],
+            options={
+                "ordering": ["-timestamp"],
+            },
+        ),
+        migrations.AddField(
+            model_name="department",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="department",
+            name="created_by",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="User who created this record",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="%(class)s_created",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddField(
+            model_name="department",
+            name="deleted",
+            field=models.DateTimeField(db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="department",
+            name="deleted_by_cascade",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name="department",
+            name="description",
+            field=models.TextField(
+                blank=True, help_text="Optional department description (max 500 characters)", max_length=500
+            ),
+        ),
+        migrations.AddField(
+            model_name="department",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="department",
+            name="updated_by",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="User who last updated this record",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="%(class)s_updated",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddField(
+            model_name="employee",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="employee",
+            name="created_by",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="User who created this record",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="%(class)s_created",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AddField(
+            model_name="employee",
+            name="deleted",
+            field=models.DateTimeField(db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name="employee",
+            name="deleted_by_cascade",
+            field=models.BooleanField(default=False, editable=False),
+        ),
+        migrations.AddField(
+            model_name="employee",
+            name="is_active",
+            field=models.BooleanField(default=True, help_text="Whether employee is currently active"),
+        ),
+        migrations.AddField(
+            model_name="employee",
+            name="salary",
+            field=models.DecimalField(
+                blank=True,
+                decimal_places=2,
+                help_text="Annual salary in USD",
+                max_digits=10,
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="employee",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="employee",
+            name="updated_by",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="User who last updated this record",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="%(class)s_updated",
+                to=settings.AUTH_USER_MODEL,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="department",
+            name="name",
+            field=models.CharField(
+                help_text="Department name must be unique across organization", max_length=100, unique=True
+            ),
+        ),
+        migrations.AlterField(
+            model_name="employee",
+            name="address",
+            field=models.TextField(help_text="Full residential address (max 500 characters)", max_length=500),
+        ),
+        migrations.AlterField(
+            model_name="employee",
+            name="date_of_joining",
+            field=models.DateField(help_text="Employee's first day of work"),
+        ),
+        migrations.AlterField(
+            model_name="employee",
+            name="department",
+            field=models.ForeignKey(
+                help_text="Department where employee works",
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="employees",
+                to="employees.department",
+            ),
+        ),
+        migrations.AlterField(
+            model_name="employee",
+            name="email",
+            field=models.EmailField(
+                help_text="Unique email address for the employee",
+                max_length=254,
+                unique=True,
+                validators=[django.core.validators.EmailValidator()],
+            ),
+        ),
+        migrations.AlterField(
+            model_name="employee",
+            name="name",
+            field=models.CharField(help_text="Full name of the employee", max_length=100),
+        ),
+        migrations.AlterField(
+            model_name="employee",
+            name="phone_number",
+            field=models.CharField(
+                help_text="Contact phone number (include country code if international)",
+                max_length=20,
+                validators=[employees.models.validate_phone_number],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="employee",
+            index=models.Index(fields=["is_active"], name="employees_e_is_acti_ff761b_idx"),
+        ),
+        migrations.AddConstraint(
+            model_name="employee",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("salary__isnull", True), ("salary__gte", 0), _connector="OR"), name="positive_salary"
+            ),
+        ),
+        migrations.AddField(
+            model_name="auditlog",
+            name="user",
+            field=models.ForeignKey(
+                blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="auditlog",
+            index=models.Index(fields=["action", "timestamp"], name="employees_a_action_824df2_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="auditlog",
+            index=models.Index(fields=["model_name", "object_id"], name="employees_a_model_n_3034db_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="auditlog",
+            index=models.Index(fields=["user", "timestamp"], name="employees_a_user_id_fe4559_idx"),
+        ),
+    ]
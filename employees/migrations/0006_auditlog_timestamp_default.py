@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-10-14 05:56
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0005_auditlog_department_created_at_department_created_by_and_more"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="auditlog",
+            name="timestamp",
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.4 on 2026-10-14 06:06
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0006_auditlog_timestamp_default"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="auditlog",
+            name="employees_a_model_n_3034db_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="auditlog",
+            name="employees_a_user_id_fe4559_idx",
+        ),
+        migrations.AddIndex(
+            model_name="auditlog",
+            index=models.Index(fields=["model_name", "object_id", "-timestamp"], name="audit_obj_time_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="auditlog",
+            index=models.Index(fields=["user", "-timestamp"], name="audit_user_time_idx"),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-10-14 06:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0007_auditlog_history_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="employee",
+            index=models.Index(condition=models.Q(("deleted__isnull", True)), fields=["deleted"], name="emp_live_idx"),
+        ),
+    ]
@@ -0,0 +1,99 @@
+from datetime import date
+
+from django.db import migrations
+
+# On PostgreSQL, rebuild employees_auditlog as a table range-partitioned by
+# month on "timestamp", so each partition's indexes stay small and old months
+# can be detached in O(1). Other backends (e.g. the SQLite test database)
+# keep the plain table; Django sees the same columns either way.
+#
+# New monthly partitions are created ahead of time by
+# `manage.py create_audit_partitions` (run it from cron); rows outside every
+# monthly range, including all history copied here, land in the DEFAULT
+# partition until the command carves their month out of it.
+#
+# Works on PostgreSQL 11+ (CI runs 14): identity columns on partitioned tables
+# need 17, so the parent's id is fed by a plain sequence instead.
+TABLE = "employees_auditlog"
+OLD_TABLE = "employees_auditlog_unpartitioned"
+SEQUENCE = f"{TABLE}_id_seq"
+USER_FK = f"{TABLE}_user_id_fk_auth_user_id"
+MONTHS_AHEAD = 3
+
+
+def month_starts(count):
+    today = date.today()
+    year, month = today.year, today.month
+    for _ in range(count + 1):
+        yield date(year, month, 1)
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+def partition_auditlog(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    AuditLog = apps.get_model("employees", "AuditLog")
+    execute = schema_editor.execute
+
+    # LIKE without INCLUDING IDENTITY: id comes over as a plain NOT NULL bigint
+    execute(f"ALTER TABLE {TABLE} RENAME TO {OLD_TABLE}")
+    execute(f'CREATE TABLE {TABLE} (LIKE {OLD_TABLE} INCLUDING DEFAULTS) PARTITION BY RANGE ("timestamp")')
+    execute(f"CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT")
+    starts = list(month_starts(MONTHS_AHEAD + 1))
+    for start, end in zip(starts, starts[1:]):
+        execute(
+            f"CREATE TABLE {TABLE}_y{start:%Y}m{start:%m} PARTITION OF {TABLE} "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+
+    # Copy history, then drop the old table (and with it its identity sequence
+    # and the constraint/index names, which are reused below)
+    execute(f"INSERT INTO {TABLE} SELECT * FROM {OLD_TABLE}")
+    execute(f"DROP TABLE {OLD_TABLE}")
+
+    # OWNED BY keeps pg_get_serial_sequence() (and so Django's sequence resets) working
+    execute(f"CREATE SEQUENCE {SEQUENCE} AS bigint OWNED BY {TABLE}.id")
+    execute(f"SELECT setval('{SEQUENCE}', COALESCE(MAX(id), 0) + 1, false) FROM {TABLE}")
+    execute(f"ALTER TABLE {TABLE} ALTER COLUMN id SET DEFAULT nextval('{SEQUENCE}')")
+
+    # A partitioned table's primary key must include the partition key. Django's
+    # state still has "id" as the primary key; the sequence keeps id unique on its own.
+    execute(f'ALTER TABLE {TABLE} ADD CONSTRAINT {TABLE}_pkey PRIMARY KEY (id, "timestamp")')
+    execute(
+        f"ALTER TABLE {TABLE} ADD CONSTRAINT {USER_FK} FOREIGN KEY (user_id) "
+        f"REFERENCES auth_user (id) DEFERRABLE INITIALLY DEFERRED"
+    )
+    # Created on the parent, these cascade to every partition. The (user, -timestamp)
+    # index also serves the FK, so the old single-column user_id index isn't rebuilt.
+    for index in AuditLog._meta.indexes:
+        schema_editor.add_index(AuditLog, index)
+
+
+def unpartition_auditlog(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    AuditLog = apps.get_model("employees", "AuditLog")
+    columns = ", ".join(schema_editor.quote_name(field.column) for field in AuditLog._meta.local_concrete_fields)
+    execute = schema_editor.execute
+
+    # Park the rows, drop the partitions (and the sequence they own), then let
+    # Django rebuild the plain table exactly as migration 0008 left it
+    execute(f"CREATE TEMPORARY TABLE {OLD_TABLE} AS SELECT {columns} FROM {TABLE}")
+    execute(f"DROP TABLE {TABLE}")
+    schema_editor.create_model(AuditLog)
+    execute(f"INSERT INTO {TABLE} ({columns}) SELECT {columns} FROM {OLD_TABLE}")
+    execute(f"DROP TABLE {OLD_TABLE}")
+    execute(
+        f"SELECT setval(pg_get_serial_sequence('{TABLE}', 'id'), COALESCE(MAX(id), 0) + 1, false) FROM {TABLE}"
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0008_employee_live_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition_auditlog, unpartition_auditlog),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.4 on 2026-10-14 06:31
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0009_partition_auditlog"),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="employee",
+            name="employees_e_departm_99b42d_idx",
+        ),
+        migrations.RemoveIndex(
+            model_name="employee",
+            name="employees_e_email_8f5bbc_idx",
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.4 on 2026-10-14 06:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0010_drop_redundant_employee_indexes"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="employee",
+            name="employees_e_is_acti_ff761b_idx",
+        ),
+        migrations.AddIndex(
+            model_name="employee",
+            index=models.Index(condition=models.Q(("is_active", True)), fields=["is_active"], name="emp_active_idx"),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 5.2.4 on 2026-10-14 06:33
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_employee_counts(apps, schema_editor):
+    Department = apps.get_model("employees", "Department")
+    Employee = apps.get_model("employees", "Employee")
+    live_employees = (
+        Employee._base_manager.filter(department=OuterRef("pk"), deleted__isnull=True)
+        .order_by()
+        .values("department")
+        .annotate(total=Count("*"))
+        .values("total")
+    )
+    Department._base_manager.update(employee_count=Coalesce(Subquery(live_employees), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0011_employee_active_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="department",
+            name="employee_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                editable=False,
+                help_text="Number of (not soft-deleted) employees, kept up to date by Employee signals",
+            ),
+        ),
+        migrations.RunPython(backfill_employee_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.4 on 2026-10-14 06:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0012_department_employee_count"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="employee",
+            name="salary",
+            field=models.DecimalField(
+                blank=True,
+                decimal_places=2,
+                help_text="Annual salary in USD (0 to 10,000,000, enforced by the salary constraints)",
+                max_digits=10,
+                null=True,
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="employee",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("salary__isnull", True), ("salary__lte", 10000000), _connector="OR"),
+                name="salary_cap",
+                violation_error_message="Salary cannot exceed $10,000,000.",
+            ),
+        ),
+        migrations.AlterConstraint(
+            model_name="employee",
+            name="positive_salary",
+            constraint=models.CheckConstraint(
+                condition=models.Q(("salary__isnull", True), ("salary__gte", 0), _connector="OR"),
+                name="positive_salary",
+                violation_error_message="Salary cannot be negative.",
+            ),
+        ),
+    ]
@@ -1,24 +1,15 @@
+import re
+
 from django.db import models
 from django.core.validators import EmailValidator, MinValueValidator, MaxValueValidator
 from django.core.exceptions import ValidationError
-from .mixins import BaseModel, TimestampMixin, SoftDeleteMixin
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+from .mixins import BaseModel
 
-
-def validate_salary_range(value):
-    """
-    Custom validator to ensure salary is within reasonable business limits.
-    
-    Args:
-        value (Decimal): The salary value to validate
-        
-    Raises:
-        ValidationError: If salary is negative or unreasonably high
-    """
-    if value is not None:
-        if value < 0:
-            raise ValidationError('Salary cannot be negative.')
-        if value > 10000000:  # 10 million cap
-            raise ValidationError('Salary cannot exceed $10,000,000.')
+# Compiled once at import; the validator runs on every employee create and update
+_PHONE_RE = re.compile(r'^\+?[\d\s\-\(\)]+$')
+_PHONE_PUNCTUATION = str.maketrans('', '', ' -()+')
 
 
 def validate_phone_number(value):
@@ -31,10 +22,9 @@ def validate_phone_number(value):
     Raises:
         ValidationError: If phone number format is invalid
     """
-    import re
-    if value and not re.match(r'^\+?[\d\s\-\(\)]+$', value):
+    if value and not _PHONE_RE.match(value):
         raise ValidationError('Enter a valid phone number.')
-    if value and len(value.replace(' ', '').replace('-', '').replace('(', '').replace(')', '').replace('+', '')) < 10:
+    if value and len(value.translate(_PHONE_PUNCTUATION)) < 10:
         raise ValidationError('Phone number must be at least 10 digits.')
 
 # Department model to store department names
@@ -49,13 +39,37 @@ class Department(BaseModel):
         max_length=500,
         help_text="Optional department description (max 500 characters)"
     )
+    employee_count = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Number of (not soft-deleted) employees, kept up to date by Employee signals"
+    )
+
+    @classmethod
+    def refresh_employee_counts(cls, department_ids):
+        """
+        Recount employee_count for the given departments in one UPDATE.
+        Recounting (rather than +1/-1) stays correct for moves, soft deletes
+        and restores, and repairs counts after bulk writes that skip signals.
+        """
+        live_employees = (
+            Employee.all_objects
+            .filter(department=models.OuterRef('pk'), deleted__isnull=True)
+            .order_by()
+            .values('department')
+            .annotate(total=models.Count('*'))
+            .values('total')
+        )
+        cls.all_objects.filter(pk__in=department_ids).update(
+            employee_count=Coalesce(models.Subquery(live_employees), 0)
+        )
 
     def clean(self):
         """Custom validation for the Department model."""
         super().clean()
         if self.name:
-            self.name = self.name.strip()  # Remove leading/trailing whitespace
-            if len(self.name) < 2:
+            self.name = name = self.name.strip()  # Remove leading/trailing whitespace
+            if len(name) < 2:
                 raise ValidationError({'name': 'Department name must be at least 2 characters long.'})
 
     def __str__(self):
@@ -89,8 +103,7 @@ class Employee(BaseModel):
         decimal_places=2, 
         null=True, 
         blank=True,
-        validators=[validate_salary_range],
-        help_text="Annual salary in USD"
+        help_text="Annual salary in USD (0 to 10,000,000, enforced by the salary constraints)"
     )
     is_active = models.BooleanField(
         default=True, 
@@ -104,17 +117,25 @@ class Employee(BaseModel):
     )
 
     class Meta:
+        # email (unique=True) and department (ForeignKey) already get their own indexes
         indexes = [
-            models.Index(fields=['department']),
             models.Index(fields=['date_of_joining']),
-            models.Index(fields=['email']),
             models.Index(fields=['name']),
-            models.Index(fields=['is_active']),
+            # Only active rows: a full index on a two-valued flag is rarely worth it to the planner
+            models.Index(fields=['is_active'], condition=models.Q(is_active=True), name='emp_active_idx'),
+            # Live (not soft-deleted) rows: matches the deleted IS NULL filter safedelete adds to every query
+            models.Index(fields=['deleted'], condition=models.Q(deleted__isnull=True), name='emp_live_idx'),
         ]
         constraints = [
             models.CheckConstraint(
-                check=models.Q(salary__isnull=True) | models.Q(salary__gte=0),
-                name='positive_salary'
+                condition=models.Q(salary__isnull=True) | models.Q(salary__gte=0),
+                name='positive_salary',
+                violation_error_message='Salary cannot be negative.',
+            ),
+            models.CheckConstraint(
+                condition=models.Q(salary__isnull=True) | models.Q(salary__lte=10000000),  # 10 million cap
+                name='salary_cap',
+                violation_error_message='Salary cannot exceed $10,000,000.',
             ),
         ]
 
@@ -124,22 +145,28 @@ class Employee(BaseModel):
         
         # Validate name
         if self.name:
-            self.name = self.name.strip()
-            if len(self.name) < 2:
+            self.name = name = self.name.strip()
+            if len(name) < 2:
                 raise ValidationError({'name': 'Employee name must be at least 2 characters long.'})
         
         # Validate email domain (basic business validation)
         if self.email:
-            self.email = self.email.lower().strip()
+            self.email = self.email.strip().lower()
         
         # Validate date of joining is not in the future
-        from django.utils import timezone
         if self.date_of_joining and self.date_of_joining > timezone.now().date():
             raise ValidationError({'date_of_joining': 'Date of joining cannot be in the future.'})
 
     def __str__(self):
         return self.name  # Display employee name in admin and queries
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored department so moving an employee also recounts the old one
+        instance._db_department_id = instance.__dict__.get('department_id')
+        return instance
+
     @property
     def is_deleted(self):
         """Check if this employee is soft deleted."""
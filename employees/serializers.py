@@ -1,3 +1,4 @@
+from django.db import models
 from rest_framework import serializers
 from .models import Department, Employee
 
@@ -21,3 +22,47 @@ class EmployeeSerializer(serializers.ModelSerializer):
             'id', 'name', 'email', 'phone_number', 'address',
             'date_of_joining', 'department', 'department_id'
         ]
+
+
+# Lean read-only serializers for list pages: plain Serializers with explicit
+# fields skip ModelSerializer's field introspection, so each row costs less to render.
+# The nested department stays the full DepartmentSerializer, so list rows match detail responses.
+class EmployeeListPageSerializer(serializers.ListSerializer):
+    """Renders each department once per page instead of once per employee."""
+
+    def to_representation(self, data):
+        employees = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+        # Departments were joined by the queryset, so this costs no queries
+        self.dept_map = {
+            employee.department_id: DepartmentSerializer(employee.department).data
+            for employee in employees
+        }
+        return [self.child.to_representation(employee) for employee in employees]
+
+
+class EmployeeListSerializer(serializers.Serializer):
+    id = serializers.IntegerField(read_only=True)
+    name = serializers.CharField(read_only=True)
+    email = serializers.EmailField(read_only=True)
+    phone_number = serializers.CharField(read_only=True)
+    address = serializers.CharField(read_only=True)
+    date_of_joining = serializers.DateField(read_only=True)
+    department = DepartmentSerializer(read_only=True)
+
+    class Meta:
+        list_serializer_class = EmployeeListPageSerializer
+
+    def to_representation(self, instance):
+        dept_map = getattr(self.parent, 'dept_map', None)
+        if dept_map is None:
+            return super().to_representation(instance)
+        # On a list page, build the row directly and reuse the page's department dicts
+        return {
+            'id': instance.id,
+            'name': instance.name,
+            'email': instance.email,
+            'phone_number': instance.phone_number,
+            'address': instance.address,
+            'date_of_joining': self.fields['date_of_joining'].to_representation(instance.date_of_joining),
+            'department': dept_map[instance.department_id],
+        }
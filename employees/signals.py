@@ -0,0 +1,19 @@
+"""
+Signal handlers that keep Department.employee_count in step with Employee writes.
+"""
+from .models import Department
+
+
+def _touched_departments(instance):
+    return {instance.department_id, getattr(instance, '_db_department_id', None)} - {None}
+
+
+def employee_count_post_save(sender, instance, **kwargs):
+    """Recount the employee's department (and the old one after a move); soft deletes save too."""
+    Department.refresh_employee_counts(_touched_departments(instance))
+    instance._db_department_id = instance.department_id
+
+
+def employee_count_post_delete(sender, instance, **kwargs):
+    """Recount the department of a hard-deleted employee."""
+    Department.refresh_employee_counts(_touched_departments(instance))
@@ -1,15 +1,17 @@
 from django.urls import path, include
-from rest_framework.routers import DefaultRouter
-from .views import DepartmentViewSet, EmployeeViewSet
+from rest_framework.routers import SimpleRouter
+from .views import DepartmentViewSet, EmployeeViewSet, EmployeesAPIRootView
 from .async_views import async_employee_report, async_department_analytics, async_health_check
 
-# Set up router for automatic URL routing
-router = DefaultRouter()
+# Set up router for automatic URL routing.
+# SimpleRouter: no browsable API-root view reversing every route on each hit
+router = SimpleRouter()
 router.register(r'departments', DepartmentViewSet)
 router.register(r'employees', EmployeeViewSet)
 
 # Include router URLs plus async endpoints
 urlpatterns = [
+    path('', EmployeesAPIRootView.as_view(endpoints=[prefix for prefix, _, _ in router.registry])),
     path('', include(router.urls)),
     
     # Async endpoints for heavy operations
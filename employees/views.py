@@ -1,8 +1,10 @@
 from rest_framework import viewsets, filters  # add filters
-from django_filters.rest_framework import DjangoFilterBackend
+from employee_project.filters import LazyDjangoFilterBackend
 from .models import Department, Employee
-from .serializers import DepartmentSerializer, EmployeeSerializer
+from .serializers import DepartmentSerializer, EmployeeListSerializer, EmployeeSerializer
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework.response import Response
+from rest_framework.views import APIView
 
 
 class DepartmentViewSet(viewsets.ModelViewSet):
@@ -11,7 +13,7 @@ class DepartmentViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticatedOrReadOnly]
 
     # Add filtering and ordering capabilities
-    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
+    filter_backends = [LazyDjangoFilterBackend, filters.OrderingFilter]
     ordering_fields = ['id', 'name']  # fields you can order by
     ordering = ['id']  # default ordering
 
@@ -24,13 +26,32 @@ class EmployeeViewSet(viewsets.ModelViewSet):
     partial_update: Update some fields (JWT required).
     destroy: Delete an employee (JWT required).
     """
-    queryset = Employee.objects.all()
+    # The serializer nests the department, so join it instead of querying it per employee
+    queryset = Employee.objects.select_related('department')
     serializer_class = EmployeeSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
 
     # Add filtering and ordering capabilities
-    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
+    filter_backends = [LazyDjangoFilterBackend, filters.OrderingFilter]
     filterset_fields = ['department', 'date_of_joining']  # existing filters
     ordering_fields = ['id', 'name', 'email', 'date_of_joining', 'department']  # allow ?ordering=name
     ordering = ['id']  # default ordering
-    
\ No newline at end of file
+
+    def get_serializer_class(self):
+        # List pages render many rows, so use the lean read-only serializer there
+        if self.action == 'list':
+            return EmployeeListSerializer
+        return super().get_serializer_class()
+
+
+class EmployeesAPIRootView(APIView):
+    """
+    Links to the department and employee endpoints.
+    Stands in for DefaultRouter's API root: the links are built relative to
+    the request path, so there is no reverse() per route on every hit.
+    """
+    endpoints = ()  # router prefixes, set in urls.py
+    swagger_schema = None  # keep it out of the API docs, like the router's root view
+
+    def get(self, request, *args, **kwargs):
+        return Response({prefix: request.build_absolute_uri(f'{prefix}/') for prefix in self.endpoints})
@@ -36,17 +36,23 @@ class Command(BaseCommand):
                     self.style.WARNING(f'Cache key not found: {key}')
                 )
         elif pattern:
-            # Clear keys matching pattern (requires more advanced cache backend)
-            self.stdout.write(
-                self.style.WARNING(
-                    'Pattern matching requires Redis or Memcached backend. '
-                    'Using clear all for local memory cache.'
+            # Clear only the keys matching pattern, keeping unrelated warm keys
+            deleted = self.delete_pattern(pattern)
+            if deleted is None:
+                self.stdout.write(
+                    self.style.WARNING(
+                        'Pattern matching requires a Redis backend (django-redis). '
+                        'Using clear all for this cache backend.'
+                    )
+                )
+                cache.clear()
+                self.stdout.write(
+                    self.style.SUCCESS('Cache cleared successfully')
+                )
+            else:
+                self.stdout.write(
+                    self.style.SUCCESS(f'Cleared {deleted} cache keys matching: {pattern}')
                 )
-            )
-            cache.clear()
-            self.stdout.write(
-                self.style.SUCCESS('Cache cleared successfully')
-            )
         else:
             # Clear all cache
             cache.clear()
@@ -65,4 +71,30 @@ class Command(BaseCommand):
             
         self.stdout.write(
             self.style.SUCCESS('Dashboard cache keys cleared')
-        )
\ No newline at end of file
+        )
+
+    def delete_pattern(self, pattern, batch_size=1000):
+        """
+        Delete keys matching pattern on a django-redis cache and return how many
+        were removed, or None if the backend can't match keys.
+        SCAN walks the keyspace incrementally and UNLINK frees values in the
+        background, so neither blocks Redis the way KEYS + DEL would.
+        """
+        # Only django-redis caches have delete_pattern; the import is optional for the same reason
+        if not hasattr(cache, 'delete_pattern'):
+            return None
+        from django_redis import get_redis_connection
+
+        conn = get_redis_connection('default')
+        # Stored keys carry the cache's KEY_PREFIX and version, so match on the full key
+        match = str(cache.make_key(pattern))
+        deleted = 0
+        batch = []
+        for redis_key in conn.scan_iter(match=match, count=batch_size):
+            batch.append(redis_key)
+            if len(batch) >= batch_size:
+                deleted += conn.unlink(*batch)
+                batch = []
+        if batch:
+            deleted += conn.unlink(*batch)
+        return deleted
@@ -0,0 +1,87 @@
+import pytest
+from django.conf import settings as django_settings
+from django.contrib.auth.models import User
+from django.db.models import Max
+from django.test import override_settings
+from safedelete.models import HARD_DELETE
+
+from employees.audit import AuditLog
+from tests.factories import DepartmentFactory, EmployeeFactory
+
+
+def pytest_configure(config):
+    """
+    Render API responses as JSON only. The tests never ask for HTML, and leaving the
+    browsable API renderer out skips its template loading during content negotiation.
+    This can't be a fixture: views copy DEFAULT_RENDERER_CLASSES onto the class when
+    they're imported, which happens while the test modules are collected.
+    """
+    override_settings(REST_FRAMEWORK={
+        **django_settings.REST_FRAMEWORK,
+        'DEFAULT_RENDERER_CLASSES': ['rest_framework.renderers.JSONRenderer'],
+    }).enable()
+
+
+@pytest.fixture(autouse=True, scope='session')
+def fast_password_hasher():
+    """Hash test passwords with MD5 instead of PBKDF2's many iterations; nothing here needs real hashing."""
+    with override_settings(PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher']):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def sync_audit_log(settings):
+    """Write audit entries inside the test transaction instead of on the worker thread."""
+    settings.AUDIT_LOG_ASYNC = False
+
+
+@pytest.fixture(scope='session')
+def api_user(django_db_setup, django_db_blocker):
+    """
+    One API user for the whole session, created once outside the per-test transactions.
+    Tests only authenticate as this user, so sharing it is safe; get_or_create keeps
+    it working with --reuse-db.
+    """
+    with django_db_blocker.unblock():
+        user, _ = User.objects.get_or_create(
+            username='api-user', defaults={'email': 'api-user@example.com'}
+        )
+    return user
+
+
+@pytest.fixture(scope='class')
+def class_rows(django_db_setup, django_db_blocker):
+    """
+    Rows shared by a class's tests, like TestCase.setUpTestData. Class-scoped fixtures
+    commit them once, outside the per-test transactions, and append them here; when
+    the class ends they're hard-deleted, last first, along with the audit entries
+    their saves wrote. Audit entries are written synchronously meanwhile so none
+    is left behind on the worker.
+    """
+    rows = []
+    with override_settings(AUDIT_LOG_ASYNC=False):
+        with django_db_blocker.unblock():
+            last_audit_id = AuditLog.objects.aggregate(last=Max('id'))['last'] or 0
+        yield rows
+        with django_db_blocker.unblock():
+            for row in reversed(rows):
+                row.delete(force_policy=HARD_DELETE)
+            AuditLog.objects.filter(id__gt=last_audit_id).delete()
+
+
+@pytest.fixture(scope='class')
+def shared_department(class_rows, django_db_blocker):
+    """A department shared by a class's tests that only need it as a foreign key."""
+    with django_db_blocker.unblock():
+        department = DepartmentFactory()
+    class_rows.append(department)
+    return department
+
+
+@pytest.fixture(scope='class')
+def shared_employee(class_rows, django_db_blocker):
+    """An employee shared by a class's tests that only need it as a foreign key."""
+    with django_db_blocker.unblock():
+        employee = EmployeeFactory()
+    class_rows.extend([employee.department, employee])
+    return employee
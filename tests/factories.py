@@ -31,6 +31,8 @@ class DepartmentFactory(factory.django.DjangoModelFactory):
     """Factory for creating test departments."""
     class Meta:
         model = Department
+        # Faker company names can repeat; reuse the row instead of hitting the unique constraint
+        django_get_or_create = ('name',)
     
     name = factory.Faker('company')
 
@@ -42,10 +44,23 @@ class EmployeeFactory(factory.django.DjangoModelFactory):
     
     name = factory.Faker('name')
     email = factory.LazyAttribute(lambda obj: f'{obj.name.lower().replace(" ", ".")}@company.com')
-    phone_number = factory.Faker('phone_number')
+    # Always passes validate_phone_number (Faker's phone_number can add "x123" extensions)
+    phone_number = factory.Faker('numerify', text='+1##########')
     address = factory.Faker('address')
     date_of_joining = factory.Faker('date_between', start_date='-2y', end_date='today')
     department = factory.SubFactory(DepartmentFactory)
+    
+    @classmethod
+    def bulk_batch(cls, size, department, **kwargs):
+        """
+        Insert size employees in one department with a single bulk_create.
+        Unlike create_batch, no save() runs, so there are no post_save side effects
+        (audit entries, list-cache bumps); only the department's employee_count
+        is refreshed here. Use it for volume, and create_batch to exercise signals.
+        """
+        employees = Employee.objects.bulk_create(cls.build_batch(size, department=department, **kwargs))
+        Department.refresh_employee_counts({department.pk})
+        return employees
 
 
 class AttendanceFactory(factory.django.DjangoModelFactory):
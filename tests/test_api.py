@@ -2,33 +2,118 @@
 Test cases for API endpoints.
 These tests make sure your API works correctly.
 """
+import io
+
+import factory
 import pytest
+from datetime import timedelta
+from django.core.cache import cache
+from django.core.management import call_command
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APIClient
 from django.contrib.auth.models import User
 from rest_framework_simplejwt.tokens import RefreshToken
-from tests.factories import EmployeeFactory, DepartmentFactory, AttendanceFactory, UserFactory
+from employees.models import Department, Employee
+from attendance import list_cache
+from attendance.models import Attendance
+from employees.serializers import EmployeeListSerializer
+from employees.views import EmployeeViewSet
+from employees import health as health_module
+from employees.health import PERF_SAMPLE_KEY, check_performance_health
+from django.db import IntegrityError, connection, transaction
+from reports import views as reports_views
+from reports.views import (
+    ATTENDANCE_BY_MONTH_CACHE_KEY, DEPT_COUNTS_CACHE_KEY,
+    _get_attendance_by_month, _get_department_employee_counts,
+)
+from employee_project.exceptions import get_integrity_error_message
+from employee_project.filters import LazyDjangoFilterBackend
+from employee_project import middleware as middleware_module
+from employee_project.middleware import RATE_LIMIT_WINDOW, RateLimitMiddleware
+from tests.factories import EmployeeFactory, DepartmentFactory, AttendanceFactory, PerformanceFactory, UserFactory
 
+# Resolved once at import; pytest-django has set Django up before test modules load
+EMPLOYEE_LIST_URL = reverse('employee-list')
+TOKEN_OBTAIN_URL = reverse('token_obtain_pair')
+DEPARTMENT_LIST_URL = reverse('department-list')
+ATTENDANCE_LIST_URL = reverse('attendance-list')
+ATTENDANCE_EXPORT_URL = reverse('attendance-export')
+PERFORMANCE_LIST_URL = reverse('performance-list')
+DEPARTMENT_ANALYTICS_URL = reverse('async_department_analytics')
+EMPLOYEE_REPORT_URL = reverse('async_employee_report')
+DASHBOARD_URL = reverse('dashboard')
+HEALTH_CHECK_URL = reverse('health_check')
 
-@pytest.fixture
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache so cached list pages don't leak between tests."""
+    cache.clear()
+
+
+@pytest.fixture(scope='session')
 def api_client():
-    """Create an API client for testing."""
+    """One API client for the whole session; the auth fixtures log it out after each test."""
     return APIClient()
 
 
 @pytest.fixture
-def authenticated_user():
-    """Create and return an authenticated user."""
-    return UserFactory()
+def authenticated_user(api_user):
+    """Return the session-wide API user (created once, not per test)."""
+    return api_user
+
+
+@pytest.fixture(scope='session')
+def access_token(api_user):
+    """Sign the API user's JWT once per session; every test reuses it."""
+    return str(RefreshToken.for_user(api_user).access_token)
+
+
+@pytest.fixture
+def jwt_auth_client(api_client, access_token):
+    """Create an API client that authenticates with a real JWT Bearer header."""
+    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {access_token}')
+    yield api_client
+    api_client.logout()
 
 
 @pytest.fixture
 def auth_client(api_client, authenticated_user):
-    """Create an authenticated API client."""
-    refresh = RefreshToken.for_user(authenticated_user)
-    api_client.credentials(HTTP_AUTHORIZATION=f'Bearer {refresh.access_token}')
-    return api_client
+    """Create an authenticated API client (skips JWT decoding; see jwt_auth_client for that)."""
+    api_client.force_authenticate(user=authenticated_user)
+    yield api_client
+    api_client.logout()
+
+
+@pytest.fixture
+def bulk_employees(db):
+    """Return a helper that inserts n employees (sharing one department) with a single INSERT."""
+    def create(n, department=None):
+        department = department or DepartmentFactory()
+        return EmployeeFactory.bulk_batch(n, department)
+    return create
+
+
+@pytest.fixture
+def bulk_attendance(db):
+    """Return a helper that inserts n attendance records for one employee with a single INSERT."""
+    def create(n, employee=None):
+        employee = employee or EmployeeFactory()
+        today = timezone.now().date()
+        # One record per day: an employee can't have two records on the same date
+        records = [AttendanceFactory.build(employee=employee, date=today - timedelta(days=i)) for i in range(n)]
+        return Attendance.objects.bulk_create(records)
+    return create
+
+
+@pytest.fixture
+def bulk_departments(db):
+    """Return a helper that inserts n departments with a single INSERT."""
+    def create(n):
+        return Department.objects.bulk_create(DepartmentFactory.build_batch(n))
+    return create
 
 
 @pytest.mark.django_db
@@ -37,14 +122,14 @@ class TestAuthentication:
     
     def test_unauthenticated_access_denied(self, api_client):
         """Test that unauthenticated users can't access protected endpoints."""
-        url = reverse('employee-list')
+        url = EMPLOYEE_LIST_URL
         response = api_client.get(url)
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
     
     def test_jwt_token_authentication(self, api_client):
         """Test JWT token authentication works."""
         user = UserFactory()
-        url = reverse('token_obtain_pair')
+        url = TOKEN_OBTAIN_URL
         
         # Get JWT token
         data = {'username': user.username, 'password': 'defaultpassword'}
@@ -52,48 +137,92 @@ class TestAuthentication:
         
         # Should fail with wrong password (factory doesn't set usable password)
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    
+    def test_jwt_bearer_token_grants_access(self, jwt_auth_client):
+        """Test that a valid JWT Bearer header authenticates write requests."""
+        url = DEPARTMENT_LIST_URL
+        response = jwt_auth_client.post(url, {'name': 'JWT Department'}, format='json')
+        assert response.status_code == status.HTTP_201_CREATED
 
 
 @pytest.mark.django_db 
 class TestEmployeeAPI:
     """Test Employee API endpoints."""
     
-    def test_list_employees(self, auth_client):
-        """Test listing employees."""
-        # Create test employees
-        EmployeeFactory.create_batch(3)
+    def test_employee_list_create_roundtrip(self, auth_client, bulk_employees, django_assert_num_queries):
+        """Test listing employees, creating one, and seeing it in the next list."""
+        employees = bulk_employees(3)
         
-        url = reverse('employee-list')
-        response = auth_client.get(url)
+        url = EMPLOYEE_LIST_URL
+        # COUNT for pagination + one SELECT joining the department
+        with django_assert_num_queries(2):
+            response = auth_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data['results']) == 3
-    
-    def test_create_employee(self, auth_client):
-        """Test creating an employee."""
-        department = DepartmentFactory()
         
-        url = reverse('employee-list')
         data = {
             'name': 'John Doe',
             'email': 'john.doe@example.com',
             'phone_number': '123-456-7890',
             'address': '123 Test St',
             'date_of_joining': '2024-01-01',
-            'department_id': department.id
+            'department_id': employees[0].department_id
         }
         
         response = auth_client.post(url, data, format='json')
         assert response.status_code == status.HTTP_201_CREATED
         assert response.data['name'] == 'John Doe'
         assert response.data['email'] == 'john.doe@example.com'
+        
+        response = auth_client.get(url)
+        assert response.data['count'] == 4
+        created = next(row for row in response.data['results'] if row['email'] == 'john.doe@example.com')
+        assert created['name'] == 'John Doe'
+        assert created['department']['id'] == employees[0].department_id
     
-    def test_create_employee_duplicate_email_fails(self, auth_client):
-        """Test that creating employee with duplicate email fails."""
-        existing_employee = EmployeeFactory(email='duplicate@example.com')
+    def test_list_employees_query_count(self, auth_client, django_assert_max_num_queries, bulk_employees):
+        """Test that listing employees doesn't query the department once per row."""
+        bulk_employees(5)
+        
+        url = EMPLOYEE_LIST_URL
+        # COUNT for pagination + one joined SELECT
+        with django_assert_max_num_queries(2):
+            response = auth_client.get(url)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['results'][0]['department']['name']
+    
+    def test_list_employees_uses_lean_serializer(self, auth_client):
+        """Test that list rows render exactly what the detail endpoint does, nested department included."""
+        employee = EmployeeFactory()
+        
+        url = EMPLOYEE_LIST_URL
+        response = auth_client.get(url)
+        
+        row = response.data['results'][0]
+        assert set(row) == {'id', 'name', 'email', 'phone_number', 'address', 'date_of_joining', 'department'}
+        assert row == auth_client.get(f'{url}{employee.id}/').data
+        assert row['department']['employee_count'] == 1
+        assert row['date_of_joining'] == employee.date_of_joining.isoformat()
+    
+    def test_list_serializer_shares_department_across_rows(self):
+        """Test that employees in the same department reuse one rendered department."""
         department = DepartmentFactory()
+        employees = EmployeeFactory.create_batch(3, department=department)
+        
+        data = EmployeeListSerializer(employees, many=True).data
+        
+        assert [row['id'] for row in data] == [e.id for e in employees]
+        assert data[0]['department'] is data[2]['department']
+        assert data[0]['department']['name'] == department.name
+    
+    def test_create_employee_duplicate_email_fails(self, auth_client, shared_department):
+        """Test that creating employee with duplicate email fails."""
+        department = shared_department
+        existing_employee = EmployeeFactory(email='duplicate@example.com', department=department)
         
-        url = reverse('employee-list')
+        url = EMPLOYEE_LIST_URL
         data = {
             'name': 'Jane Doe',
             'email': 'duplicate@example.com',  # Same email
@@ -112,11 +241,11 @@ class TestEmployeeAPI:
 class TestDepartmentAPI:
     """Test Department API endpoints."""
     
-    def test_list_departments(self, auth_client):
+    def test_list_departments(self, auth_client, bulk_departments):
         """Test listing departments."""
-        DepartmentFactory.create_batch(2)
+        bulk_departments(2)
         
-        url = reverse('department-list')
+        url = DEPARTMENT_LIST_URL
         response = auth_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
@@ -124,7 +253,7 @@ class TestDepartmentAPI:
     
     def test_create_department(self, auth_client):
         """Test creating a department."""
-        url = reverse('department-list')
+        url = DEPARTMENT_LIST_URL
         data = {'name': 'New Department'}
         
         response = auth_client.post(url, data, format='json')
@@ -136,21 +265,174 @@ class TestDepartmentAPI:
 class TestAttendanceAPI:
     """Test Attendance API endpoints."""
     
-    def test_list_attendance(self, auth_client):
+    def test_list_attendance(self, auth_client, bulk_attendance, django_assert_num_queries):
         """Test listing attendance records."""
-        AttendanceFactory.create_batch(3)
+        bulk_attendance(3)
         
-        url = reverse('attendance-list')
-        response = auth_client.get(url)
+        url = ATTENDANCE_LIST_URL
+        # One SELECT (cursor pagination skips COUNT)
+        with django_assert_num_queries(1):
+            response = auth_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
         assert len(response.data['results']) == 3
     
-    def test_create_attendance(self, auth_client):
-        """Test creating attendance record."""
+    def test_filter_attendance_by_status(self, auth_client):
+        """Test that filter params still narrow the list."""
+        employee = EmployeeFactory()
+        today = timezone.now().date()
+        AttendanceFactory(employee=employee, date=today, status='Present')
+        AttendanceFactory(employee=employee, date=today - timedelta(days=1), status='Absent')
+        
+        url = ATTENDANCE_LIST_URL
+        response = auth_client.get(url, {'status': 'Absent'})
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert [row['status'] for row in response.data['results']] == ['Absent']
+    
+    def test_filter_attendance_by_date_range(self, auth_client):
+        """Test that ?date__gte= narrows the list to recent records."""
+        employee = EmployeeFactory()
+        today = timezone.now().date()
+        AttendanceFactory(employee=employee, date=today)
+        AttendanceFactory(employee=employee, date=today - timedelta(days=40))
+        
+        url = ATTENDANCE_LIST_URL
+        response = auth_client.get(url, {'date__gte': (today - timedelta(days=30)).isoformat()})
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert [row['date'] for row in response.data['results']] == [today.isoformat()]
+    
+    def test_filter_performance_by_minimum_rating(self, auth_client):
+        """Test that ?rating__gte= returns only the higher ratings."""
+        employee = EmployeeFactory()
+        today = timezone.now().date()
+        PerformanceFactory(employee=employee, review_date=today, rating=5)
+        PerformanceFactory(employee=employee, review_date=today - timedelta(days=90), rating=2)
+        
+        url = PERFORMANCE_LIST_URL
+        response = auth_client.get(url, {'rating__gte': 4})
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert [row['rating'] for row in response.data['results']] == [5]
+    
+    def test_create_performance_rejects_out_of_range_rating(self, auth_client):
+        """Test that an out-of-range rating is a 400, not a database error."""
+        employee = EmployeeFactory()
+        data = {'employee': employee.id, 'rating': 6, 'review_date': timezone.now().date().isoformat()}
+        
+        response = auth_client.post(PERFORMANCE_LIST_URL, data)
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'rating' in response.data['details']
+    
+    def test_list_attendance_uses_cursor_pagination(self, auth_client):
+        """Test that attendance pages link by cursor instead of page number."""
+        employee = EmployeeFactory()
+        today = timezone.now().date()
+        for offset in range(51):
+            AttendanceFactory(employee=employee, date=today - timedelta(days=offset))
+        
+        url = ATTENDANCE_LIST_URL
+        response = auth_client.get(url)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert 'count' not in response.data
+        assert len(response.data['results']) == 50
+        assert 'cursor=' in response.data['next']
+        
+        response = auth_client.get(response.data['next'])
+        assert len(response.data['results']) == 1
+    
+    def test_list_attendance_query_count(self, auth_client, django_assert_max_num_queries, bulk_attendance):
+        """Test that listing attendance doesn't query once per row."""
+        bulk_attendance(5)
+        
+        url = ATTENDANCE_LIST_URL
+        # One joined SELECT (cursor pagination skips COUNT)
+        with django_assert_max_num_queries(1):
+            response = auth_client.get(url)
+        
+        assert response.status_code == status.HTTP_200_OK
+    
+    def test_list_performance_query_count(self, auth_client, django_assert_max_num_queries):
+        """Test that listing performance reviews doesn't query once per row."""
+        # One employee (and department) for all five reviews; one review per date
+        today = timezone.now().date()
+        PerformanceFactory.create_batch(
+            5,
+            employee=EmployeeFactory(),
+            review_date=factory.Iterator([today - timedelta(days=30 * i) for i in range(5)]),
+        )
+        
+        url = PERFORMANCE_LIST_URL
+        with django_assert_max_num_queries(1):
+            response = auth_client.get(url)
+        
+        assert response.status_code == status.HTTP_200_OK
+    
+    def test_list_attendance_cache_invalidated_on_create(self, auth_client, django_capture_on_commit_callbacks):
+        """Test that a cached attendance page is refreshed after a write."""
+        employee = EmployeeFactory()
+        url = ATTENDANCE_LIST_URL
+        
+        assert auth_client.get(url).data['results'] == []
+        
+        data = {'employee': employee.id, 'date': '2024-01-01', 'status': 'Present'}
+        with django_capture_on_commit_callbacks(execute=True):
+            assert auth_client.post(url, data, format='json').status_code == status.HTTP_201_CREATED
+        
+        response = auth_client.get(url)
+        assert len(response.data['results']) == 1
+    
+    def test_list_attendance_cache_invalidated_on_orm_write(self, auth_client, django_capture_on_commit_callbacks):
+        """Test that writes outside the API (admin, scripts) also expire cached pages."""
+        url = ATTENDANCE_LIST_URL
+        assert auth_client.get(url).data['results'] == []
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            record = AttendanceFactory()
+        assert [row['id'] for row in auth_client.get(url).data['results']] == [record.id]
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            record.delete()
+        assert auth_client.get(url).data['results'] == []
+    
+    def test_list_attendance_cache_kept_on_rolled_back_write(self, auth_client, django_capture_on_commit_callbacks):
+        """Test that the version is only bumped by committed writes."""
+        url = ATTENDANCE_LIST_URL
+        assert auth_client.get(url).data['results'] == []
+        version = cache.get(list_cache.version_key(list_cache.ATTENDANCE_PREFIX))
+        
+        with django_capture_on_commit_callbacks(execute=True) as callbacks:
+            with pytest.raises(RuntimeError):
+                with transaction.atomic():
+                    AttendanceFactory()
+                    raise RuntimeError('roll back')
+        
+        assert callbacks == []
+        assert cache.get(list_cache.version_key(list_cache.ATTENDANCE_PREFIX)) == version
+    
+    def test_export_attendance_csv(self, auth_client):
+        """Test that attendance exports stream as CSV and honour filters."""
         employee = EmployeeFactory()
+        today = timezone.now().date()
+        AttendanceFactory(employee=employee, date=today, status='Present')
+        AttendanceFactory(employee=employee, date=today - timedelta(days=1), status='Late')
+        
+        url = ATTENDANCE_EXPORT_URL
+        response = auth_client.get(url, {'status': 'Present'})
         
-        url = reverse('attendance-list')
+        assert response.status_code == status.HTTP_200_OK
+        assert response['Content-Type'] == 'text/csv'
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        assert lines == ['employee,date,status', f'{employee.id},{today.isoformat()},Present']
+    
+    def test_create_attendance(self, auth_client, shared_employee):
+        """Test creating attendance record."""
+        employee = shared_employee
+        
+        url = ATTENDANCE_LIST_URL
         data = {
             'employee': employee.id,
             'date': '2024-01-01',
@@ -164,20 +446,16 @@ class TestAttendanceAPI:
 
 @pytest.mark.django_db
 class TestAPIVersioning:
-    """Test API versioning."""
+    """Test API versioning. Both versions list the same class-scoped employee."""
     
-    def test_v1_endpoints_work(self, auth_client):
+    def test_v1_endpoints_work(self, auth_client, shared_employee):
         """Test that v1 endpoints work."""
-        EmployeeFactory()
-        
         # Test v1 endpoint
         response = auth_client.get('/api/v1/employees/')
         assert response.status_code == status.HTTP_200_OK
     
-    def test_backward_compatibility(self, auth_client):
+    def test_backward_compatibility(self, auth_client, shared_employee):
         """Test that old endpoints still work for backward compatibility."""
-        EmployeeFactory()
-        
         # Test old endpoint (should still work)
         response = auth_client.get('/api/employees/')
         assert response.status_code == status.HTTP_200_OK
@@ -192,4 +470,196 @@ class TestRateLimiting:
         # This test just checks that the middleware doesn't break anything
         response = api_client.get('/api/employees/')
         # Should get 401 (unauthorized) not 500 (server error)
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
\ No newline at end of file
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+    
+    def test_anonymous_limit_enforced(self, rf):
+        """Test that the 51st anonymous API request within the hour is rejected."""
+        middleware = RateLimitMiddleware(lambda request: None)
+        request = rf.get('/api/employees/', REMOTE_ADDR='10.0.0.1')
+        
+        results = [middleware.is_rate_limited(request) for _ in range(51)]
+        
+        assert results[:50] == [False] * 50
+        assert results[50] is True
+    
+    def test_previous_window_counts_toward_limit(self, rf, monkeypatch):
+        """Test that a burst just before a window boundary still counts after it."""
+        middleware = RateLimitMiddleware(lambda request: None)
+        request = rf.get('/api/employees/', REMOTE_ADDR='10.0.0.2')
+        window_start = 1_000 * RATE_LIMIT_WINDOW
+        
+        monkeypatch.setattr(middleware_module.time, 'time', lambda: window_start - 1)
+        assert not any(middleware.is_rate_limited(request) for _ in range(50))
+        
+        monkeypatch.setattr(middleware_module.time, 'time', lambda: window_start + 1)
+        assert middleware.is_rate_limited(request) is True
+
+
+@pytest.mark.django_db
+class TestFilterBackend:
+    """Test the shared filter backend."""
+    
+    def test_filterset_class_is_built_once_per_view(self, auth_client, monkeypatch):
+        """Test that filtered employee lists reuse one generated FilterSet class."""
+        built = {}
+        monkeypatch.setattr(LazyDjangoFilterBackend, '_auto_filterset_classes', built)
+        employee = EmployeeFactory()
+        EmployeeFactory()  # in another department
+        
+        for _ in range(2):
+            response = auth_client.get(EMPLOYEE_LIST_URL, {'department': employee.department_id})
+            assert [row['id'] for row in response.data['results']] == [employee.id]
+        
+        assert list(built) == [(EmployeeViewSet, Employee)]
+        assert {'department', 'date_of_joining'} <= set(built[(EmployeeViewSet, Employee)].base_filters)
+
+
+@pytest.mark.django_db
+class TestReportEndpoints:
+    """Test the async report endpoints."""
+    
+    def test_department_analytics_counts(self, api_client):
+        """Test per-department counts come back from the grouped query."""
+        department = DepartmentFactory(name='Engineering')
+        employee = EmployeeFactory(department=department)
+        EmployeeFactory(department=department, is_active=False)
+        today = timezone.now().date()
+        AttendanceFactory(employee=employee, date=today)
+        AttendanceFactory(employee=employee, date=today - timedelta(days=1))
+        
+        response = api_client.get(DEPARTMENT_ANALYTICS_URL)
+        
+        assert response.status_code == status.HTTP_200_OK
+        engineering = response.json()['data']['departments']['Engineering']
+        assert engineering['employee_count'] == 1
+        assert engineering['attendance_count_30_days'] == 2
+    
+    def test_department_analytics_single_query(self, api_client, django_assert_num_queries):
+        """Test department analytics uses one query regardless of department count."""
+        for department in DepartmentFactory.create_batch(3):
+            EmployeeFactory(department=department)
+        
+        with django_assert_num_queries(1):
+            response = api_client.get(DEPARTMENT_ANALYTICS_URL)
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()['data']['summary']['total_departments'] == 3
+    
+    def test_employee_report_statistics(self, api_client):
+        """Test the employee report counts active and inactive employees."""
+        EmployeeFactory.create_batch(2)
+        EmployeeFactory(is_active=False)
+        
+        response = api_client.get(EMPLOYEE_REPORT_URL)
+        
+        assert response.status_code == status.HTTP_200_OK
+        stats = response.json()['data']['employee_statistics']
+        assert stats == {'total_employees': 3, 'active_employees': 2, 'inactive_employees': 1}
+
+
+@pytest.mark.django_db
+class TestDashboard:
+    """Test the reports dashboard."""
+    
+    def test_dashboard_renders(self, api_client):
+        """Test the dashboard renders both charts and caches their data."""
+        EmployeeFactory()
+        
+        response = api_client.get(DASHBOARD_URL)
+        
+        assert response.status_code == status.HTTP_200_OK
+        cached = cache.get_many([DEPT_COUNTS_CACHE_KEY, ATTENDANCE_BY_MONTH_CACHE_KEY])
+        assert len(cached[ATTENDANCE_BY_MONTH_CACHE_KEY]['labels']) == 12
+        assert sum(cached[DEPT_COUNTS_CACHE_KEY]['data']) == 1
+    
+    def test_chart_data_reuses_prefetched_cache(self, django_assert_num_queries, monkeypatch):
+        """Test chart helpers skip the database (and month labels) when get_many already found their data."""
+        def fail():
+            raise AssertionError('month labels recomputed on a cache hit')
+        monkeypatch.setattr(reports_views, '_last_12_month_labels', fail)
+        pie = {'labels': ['Engineering'], 'data': [3]}
+        bar = {'labels': [], 'datasets': []}
+        cached = {DEPT_COUNTS_CACHE_KEY: pie, ATTENDANCE_BY_MONTH_CACHE_KEY: bar}
+        
+        with django_assert_num_queries(0):
+            assert _get_department_employee_counts(cached) is pie
+            assert _get_attendance_by_month(cached) is bar
+
+
+@pytest.mark.django_db
+class TestHealthCheck:
+    """Test the health check endpoint."""
+    
+    def test_health_check_result_is_cached(self, api_client):
+        """Test that a repeat probe is served from cache unless forced."""
+        url = HEALTH_CHECK_URL
+        
+        assert api_client.get(url).json()['cached'] is False
+        assert api_client.get(url).json()['cached'] is True
+        assert api_client.get(url, {'force': 1}).json()['cached'] is False
+    
+    def test_quick_check_skips_model_and_performance_checks(self, api_client):
+        """Test that ?quick_check=true only runs the cheap checks."""
+        response = api_client.get(HEALTH_CHECK_URL, {'quick_check': 'true'})
+        
+        assert set(response.json()['checks']) == {'database', 'cache', 'system'}
+    
+    def test_performance_check_reuses_db_sample(self, api_client, django_assert_num_queries):
+        """Test that the performance check reads its DB timing from the cached sample."""
+        cache.set(PERF_SAMPLE_KEY, {'db_ms': 1.5, 'ts': 0}, 30)
+        
+        with django_assert_num_queries(0):
+            result = check_performance_health()
+        
+        assert result['database_query_time_ms'] == 1.5
+    
+    def test_performance_check_never_samples_inline(self, django_assert_num_queries):
+        """Test that without a recorded sample the check reports it instead of querying."""
+        with django_assert_num_queries(0):
+            result = check_performance_health()
+        
+        assert result['database_query_time_ms'] is None
+        
+        call_command('sample_performance', once=True, stdout=io.StringIO())
+        assert check_performance_health()['database_query_time_ms'] is not None
+    
+    def test_cached_probe_does_no_db_or_system_work(self, api_client, django_assert_num_queries, monkeypatch):
+        """Test that a probe served from cache runs no queries and no psutil calls."""
+        assert api_client.get(HEALTH_CHECK_URL).json()['cached'] is False
+        
+        def fail():
+            raise AssertionError('system metrics collected on a cached probe')
+        monkeypatch.setattr(health_module, 'check_system_health', fail)
+        
+        with django_assert_num_queries(0):
+            assert api_client.get(HEALTH_CHECK_URL).json()['cached'] is True
+    
+    @pytest.mark.skipif(connection.vendor == 'postgresql', reason='PostgreSQL uses the reltuples estimates')
+    def test_model_counts_exact_off_postgresql(self, api_client):
+        """Test that model counts fall back to exact counts when reltuples isn't available."""
+        EmployeeFactory.create_batch(2)
+        
+        models_check = api_client.get(HEALTH_CHECK_URL).json()['checks']['models']
+        
+        assert models_check['counts_estimated'] is False
+        assert models_check['model_counts']['employees'] == 2
+
+
+class TestExceptionHandler:
+    """Test the custom exception handler helpers."""
+    
+    def test_integrity_error_message_uses_pgcode(self):
+        """Test that PostgreSQL error codes pick the message without parsing text."""
+        class FakeDriverError(Exception):
+            pgcode = '23503'
+        
+        exc = IntegrityError('insert or update violates foreign key constraint')
+        exc.__cause__ = FakeDriverError()
+        
+        assert get_integrity_error_message(exc) == 'Referenced record does not exist.'
+    
+    def test_integrity_error_message_without_pgcode(self):
+        """Test the text fallback for backends without error codes."""
+        exc = IntegrityError('UNIQUE constraint failed: employees_employee.email')
+        
+        assert get_integrity_error_message(exc) == 'This record already exists. Please check for duplicates.'
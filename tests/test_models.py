@@ -2,10 +2,18 @@
 Test cases for all models.
 These tests make sure our database models work correctly.
 """
+import io
+from datetime import timedelta
+
 import pytest
 from django.core.exceptions import ValidationError
-from django.db import IntegrityError
+from django.core.management import call_command
+from django.db import IntegrityError, connection, transaction
+from django.http import HttpResponse
 from django.utils import timezone
+from employees import audit_worker
+from employees.models import Employee, validate_phone_number
+from employees.audit import AuditLog, AuditMiddleware, _current_request, get_client_ip, log_audit_event
 from tests.factories import EmployeeFactory, DepartmentFactory, AttendanceFactory, PerformanceFactory
 
 
@@ -56,6 +64,55 @@ class TestEmployeeModel:
         
         assert employee.department == department
         assert employee in department.employees.all()
+    
+    def test_salary_cap_enforced(self):
+        """Test that salaries over the cap fail validation and the database check."""
+        employee = EmployeeFactory.build(department=DepartmentFactory(), salary=10000001)
+        
+        with pytest.raises(ValidationError, match='cannot exceed'):
+            employee.full_clean()
+        with pytest.raises(IntegrityError):
+            employee.save()
+    
+    def test_phone_number_validation(self):
+        """Test that phone numbers need a valid format and at least 10 digits."""
+        validate_phone_number('+1 (555) 123-4567')
+        
+        with pytest.raises(ValidationError, match='valid phone number'):
+            validate_phone_number('555-CALL-NOW')
+        with pytest.raises(ValidationError, match='at least 10 digits'):
+            validate_phone_number('(555) 123-45')
+
+
+@pytest.mark.django_db
+class TestDepartmentEmployeeCount:
+    """Test the denormalized Department.employee_count column."""
+    
+    def test_count_follows_create_and_soft_delete(self):
+        """Test that creating and soft-deleting employees updates the counter."""
+        department = DepartmentFactory()
+        employee = EmployeeFactory(department=department)
+        EmployeeFactory(department=department)
+        
+        department.refresh_from_db()
+        assert department.employee_count == 2
+        
+        employee.delete()
+        department.refresh_from_db()
+        assert department.employee_count == 1
+    
+    def test_count_follows_department_move(self):
+        """Test that moving an employee recounts both departments."""
+        old_department, new_department = DepartmentFactory.create_batch(2)
+        EmployeeFactory(department=old_department)
+        
+        employee = Employee.objects.get(department=old_department)
+        employee.department = new_department
+        employee.save()
+        
+        old_department.refresh_from_db()
+        new_department.refresh_from_db()
+        assert (old_department.employee_count, new_department.employee_count) == (0, 1)
 
 
 @pytest.mark.django_db
@@ -69,22 +126,10 @@ class TestAttendanceModel:
         assert attendance.date
         assert attendance.status in ['Present', 'Absent', 'Late']
     
-    def test_attendance_unique_per_employee_per_date(self):
-        """Test that each employee can only have one attendance per date."""
-        employee = EmployeeFactory()
-        date = timezone.now().date()
-        
-        # First attendance should work
-        AttendanceFactory(employee=employee, date=date, status='Present')
-        
-        # Second attendance for same employee and date should fail
-        with pytest.raises(IntegrityError):
-            AttendanceFactory(employee=employee, date=date, status='Absent')
-    
     def test_attendance_string_representation(self):
         """Test the string representation of attendance."""
         attendance = AttendanceFactory(status='Present')
-        expected = f"{attendance.employee.name} - {attendance.date} - Present"
+        expected = f"{attendance.employee_id} - {attendance.date} - Present"
         assert str(attendance) == expected
 
 
@@ -103,9 +148,8 @@ class TestPerformanceModel:
         """Test that performance ratings are validated."""
         employee = EmployeeFactory()
         
-        # Valid ratings should work
-        performance = PerformanceFactory(employee=employee, rating=3)
-        performance.full_clean()  # This should not raise an error
+        # Valid ratings should work (validated unsaved; nothing here needs the row)
+        PerformanceFactory.build(employee=employee, rating=3).full_clean()  # This should not raise an error
         
         # Invalid ratings should fail
         with pytest.raises(ValidationError):
@@ -115,15 +159,155 @@ class TestPerformanceModel:
         with pytest.raises(ValidationError):
             performance = PerformanceFactory.build(employee=employee, rating=0)
             performance.full_clean()
+
+
+@pytest.mark.django_db
+class TestOneRecordPerEmployeePerDate:
+    """Test the per-employee, per-date unique constraints on attendance and reviews."""
     
-    def test_performance_unique_per_employee_per_date(self):
-        """Test that each employee can only have one review per date."""
-        employee = EmployeeFactory()
-        date = timezone.now().date()
+    @pytest.mark.parametrize('record_factory, date_field, first, second', [
+        (AttendanceFactory, 'date', {'status': 'Present'}, {'status': 'Absent'}),
+        (PerformanceFactory, 'review_date', {'rating': 4}, {'rating': 5}),
+    ])
+    def test_unique_per_employee_per_date(self, shared_employee, record_factory, date_field, first, second):
+        """Test that each employee can only have one record of a kind per date."""
+        on_date = {date_field: timezone.now().date()}
         
-        # First review should work
-        PerformanceFactory(employee=employee, review_date=date, rating=4)
+        # First record should work
+        record_factory(employee=shared_employee, **on_date, **first)
         
-        # Second review for same employee and date should fail
+        # Second record for same employee and date should fail
         with pytest.raises(IntegrityError):
-            PerformanceFactory(employee=employee, review_date=date, rating=5)
\ No newline at end of file
+            record_factory(employee=shared_employee, **on_date, **second)
+
+
+@pytest.mark.django_db
+class TestAuditLog:
+    """Test audit log writing."""
+    
+    def test_sync_audit_event_is_saved(self):
+        """Test that with the worker disabled the entry is written immediately."""
+        department = DepartmentFactory()
+        
+        entry = log_audit_event('UPDATE', department, notes='manual')
+        
+        assert entry.pk is not None
+        assert AuditLog.objects.filter(model_name='Department', object_id=str(department.pk), notes='manual').exists()
+    
+    def test_audited_model_save_is_logged(self):
+        """Test that saving an audited model writes a CREATE entry."""
+        department = DepartmentFactory()
+        
+        assert AuditLog.objects.filter(action='CREATE', model_name='Department', object_id=str(department.pk)).exists()
+    
+    def test_unaudited_model_save_is_not_logged(self, django_user_model):
+        """Test that saves of models outside the audited set never reach the handlers."""
+        django_user_model.objects.create_user(username='not-audited', password='pass')
+        
+        assert not AuditLog.objects.exists()
+    
+    def test_async_audit_event_is_queued(self, settings, monkeypatch, django_capture_on_commit_callbacks):
+        """Test that with the worker enabled the entry is queued on commit instead of inserted."""
+        settings.AUDIT_LOG_ASYNC = True
+        queued = []
+        monkeypatch.setattr(audit_worker, 'enqueue', lambda entry: queued.append(entry) or True)
+        department = DepartmentFactory()
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            assert log_audit_event('UPDATE', department, notes='manual') is None
+            assert queued == []  # nothing is queued before the commit
+        
+        assert [entry['notes'] for entry in queued] == ['manual']
+        assert not AuditLog.objects.filter(notes='manual').exists()
+    
+    def test_rolled_back_save_is_not_logged(self, settings, monkeypatch, django_capture_on_commit_callbacks):
+        """Test that a save whose transaction rolls back never reaches the audit log."""
+        settings.AUDIT_LOG_ASYNC = True
+        queued = []
+        monkeypatch.setattr(audit_worker, 'enqueue', lambda entry: queued.append(entry) or True)
+        
+        with django_capture_on_commit_callbacks(execute=True):
+            with pytest.raises(RuntimeError):
+                with transaction.atomic():
+                    DepartmentFactory()
+                    raise RuntimeError('roll back')
+        
+        assert queued == []
+        assert not AuditLog.objects.exists()
+    
+    def test_failed_batch_is_retried_one_by_one(self, monkeypatch):
+        """Test that one bad entry in a worker batch doesn't lose the others."""
+        # On the worker this drops a stale connection; here it would close the test's
+        monkeypatch.setattr(audit_worker, 'close_old_connections', lambda: None)
+        department = DepartmentFactory()
+        AuditLog.objects.all().delete()
+        good = {'action': 'UPDATE', 'model_name': 'Department', 'object_id': str(department.pk),
+                'object_repr': str(department), 'notes': 'good', 'timestamp': timezone.now()}
+        bad = {**good, 'notes': 'bad', 'changes': {'value': object()}}  # not JSON serializable
+        
+        audit_worker._flush([good, bad])
+        
+        assert list(AuditLog.objects.values_list('notes', flat=True)) == ['good']
+    
+    def test_stop_writes_entries_the_worker_never_took(self, monkeypatch):
+        """Test that stopping (at process exit) writes whatever is still queued, worker or not."""
+        monkeypatch.setattr(audit_worker, 'close_old_connections', lambda: None)
+        monkeypatch.setattr(audit_worker, '_worker', None)
+        department = DepartmentFactory()
+        audit_worker._audit_queue.put({'action': 'UPDATE', 'model_name': 'Department', 'object_id': str(department.pk),
+                                       'object_repr': str(department), 'notes': 'queued at exit', 'timestamp': timezone.now()})
+        
+        audit_worker.stop()
+        
+        assert audit_worker._audit_queue.empty()
+        assert AuditLog.objects.filter(notes='queued at exit').exists()
+    
+    @pytest.mark.skipif(connection.vendor != 'postgresql', reason='audit log is only partitioned on PostgreSQL')
+    def test_partition_command_moves_rows_out_of_default(self):
+        """Test that a month whose rows landed in DEFAULT (missed cron run) gets them moved into its partition."""
+        table = AuditLog._meta.db_table
+        today = timezone.now().date()
+        next_month = (today.replace(day=1) + timedelta(days=32)).replace(day=1)
+        partition = f'{table}_y{next_month:%Y}m{next_month:%m}'
+        with connection.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {partition}')
+        entry = log_audit_event('UPDATE', DepartmentFactory(), notes='missed')
+        # Moves the row across partitions, into DEFAULT now that next month has none
+        AuditLog.objects.filter(pk=entry.pk).update(
+            timestamp=timezone.now().replace(year=next_month.year, month=next_month.month, day=15)
+        )
+        
+        call_command('create_audit_partitions', months=2, stdout=io.StringIO())
+        
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT tableoid::regclass::text FROM {table} WHERE notes = %s', ['missed'])
+            assert cursor.fetchone()[0] == partition
+    
+    def test_middleware_scopes_request_to_call(self, rf):
+        """Test that the request is visible to signal handlers only while it is handled."""
+        seen = []
+        middleware = AuditMiddleware(lambda request: seen.append(_current_request.get()) or HttpResponse())
+        request = rf.get('/dashboard/')
+        
+        middleware(request)
+        
+        assert seen == [request]
+        assert _current_request.get() is None
+    
+    def test_middleware_skips_probe_paths(self, rf):
+        """Test that health probes pass straight through without exposing the request."""
+        seen = []
+        middleware = AuditMiddleware(lambda request: seen.append(_current_request.get()) or HttpResponse())
+        
+        middleware(rf.get('/health/live/'))
+        
+        assert seen == [None]
+    
+    def test_client_ip_uses_first_forwarded_hop(self, rf):
+        """Test that the first X-Forwarded-For hop is used and cached on the request."""
+        request = rf.get('/', HTTP_X_FORWARDED_FOR='203.0.113.7, 10.0.0.1', REMOTE_ADDR='10.0.0.2')
+        
+        assert get_client_ip(request) == '203.0.113.7'
+        
+        request.META['HTTP_X_FORWARDED_FOR'] = '198.51.100.1'
+        assert get_client_ip(request) == '203.0.113.7'